@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
@@ -32,16 +33,21 @@ class SecretsManager:
     def __init__(self, region_name: Optional[str] = None) -> None:
         self.region_name = region_name
         self._client = None
+        self._client_lock = threading.Lock()
 
     def _get_client(self):
         if self._client is None and self.region_name:
-            try:
-                self._client = boto3.client(
-                    "secretsmanager", region_name=self.region_name
-                )
-            except (BotoCoreError, ClientError):
-                logger.exception(f"Unable to create Secrets Manager client")
-                self._client = None
+            # Secrets may be fetched from worker threads; boto3 client
+            # creation on the default session is not thread-safe.
+            with self._client_lock:
+                if self._client is None:
+                    try:
+                        self._client = boto3.client(
+                            "secretsmanager", region_name=self.region_name
+                        )
+                    except (BotoCoreError, ClientError):
+                        logger.exception(f"Unable to create Secrets Manager client")
+                        self._client = None
         return self._client
 
     def get_secret(self, secret_id: Optional[str]) -> SecretResult | None:
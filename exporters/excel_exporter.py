@@ -1,62 +1,125 @@
 """Excel export utilities for audit results."""
 from __future__ import annotations
 
+import math
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
 
-import pandas as pd
+from openpyxl import Workbook
+
+_NATIVE_CELL_TYPES = (str, bool, int, float, datetime, date, time, timedelta)
 
 
 class ExcelExporter:
+    """Write audit results to an ``.xlsx`` workbook.
+
+    The workbook is opened in openpyxl's write-only mode so rows are streamed
+    to disk as they are appended instead of being held in memory. Sheets keep
+    the layout of the former pandas export: nested mappings are flattened into
+    ``parent.child`` columns and non-scalar cells are written as strings.
+    """
+
     def __init__(self, output_dir: Path) -> None:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def export(self, data: Dict[str, Any], filename: str = "audit_results.xlsx") -> Path:
         output_path = self.output_dir / filename
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-            self._write_summary_sheet(data.get("summary", {}), writer)
-            self._write_table_sheet(
-                data.get("stories_with_no_commits", []),
-                "Stories Without Commits",
-                writer,
-            )
-            self._write_table_sheet(data.get("orphan_commits", []), "Orphan Commits", writer)
-            self._write_mapping_sheet(data.get("commit_story_mapping", []), writer)
+        workbook = Workbook(write_only=True)
+        self._write_summary_sheet(data.get("summary", {}), workbook)
+        self._write_table_sheet(
+            data.get("stories_with_no_commits", []),
+            "Stories Without Commits",
+            workbook,
+        )
+        self._write_table_sheet(data.get("orphan_commits", []), "Orphan Commits", workbook)
+        self._write_mapping_sheet(data.get("commit_story_mapping", []), workbook)
+        workbook.save(output_path)
         return output_path
 
-    def _write_summary_sheet(self, summary: Dict[str, Any], writer: pd.ExcelWriter) -> None:
-        df = pd.DataFrame([summary]) if summary else pd.DataFrame()
-        df.to_excel(writer, sheet_name="Audit Summary", index=False)
+    def _write_summary_sheet(self, summary: Dict[str, Any], workbook: Workbook) -> None:
+        _write_records(workbook, "Audit Summary", [summary] if summary else [])
 
     def _write_table_sheet(
         self,
-        items: List[Dict[str, Any]],
+        items: Sequence[Dict[str, Any]],
         sheet_name: str,
-        writer: pd.ExcelWriter,
+        workbook: Workbook,
     ) -> None:
-        df = pd.json_normalize(items) if items else pd.DataFrame()
-        df.to_excel(writer, sheet_name=sheet_name[:31], index=False)
-
-    def _write_mapping_sheet(self, mappings: List[Dict[str, Any]], writer: pd.ExcelWriter) -> None:
-        rows: List[Dict[str, Any]] = []
-        for mapping in mappings:
-            commits = mapping.get("commits", [])
-            if not commits:
-                rows.append({"story_key": mapping.get("story_key"), "commit_hash": None, "commit_message": None})
-                continue
-            for commit in commits:
-                rows.append(
-                    {
-                        "story_key": mapping.get("story_key"),
-                        "story_summary": mapping.get("story_summary"),
-                        "commit_hash": commit.get("hash"),
-                        "commit_message": commit.get("message"),
-                        "commit_author": commit.get("author"),
-                        "commit_date": commit.get("date"),
-                        "repository": commit.get("repository"),
-                        "branch": commit.get("branch"),
-                    }
-                )
-        df = pd.DataFrame(rows)
-        df.to_excel(writer, sheet_name="Commit Mapping", index=False)
+        _write_records(workbook, sheet_name[:31], items, flatten=True)
+
+    def _write_mapping_sheet(self, mappings: Sequence[Dict[str, Any]], workbook: Workbook) -> None:
+        _write_records(workbook, "Commit Mapping", list(_mapping_rows(mappings)))
+
+
+def _mapping_rows(mappings: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for mapping in mappings:
+        commits = mapping.get("commits", [])
+        if not commits:
+            yield {"story_key": mapping.get("story_key"), "commit_hash": None, "commit_message": None}
+            continue
+        for commit in commits:
+            yield {
+                "story_key": mapping.get("story_key"),
+                "story_summary": mapping.get("story_summary"),
+                "commit_hash": commit.get("hash"),
+                "commit_message": commit.get("message"),
+                "commit_author": commit.get("author"),
+                "commit_date": commit.get("date"),
+                "repository": commit.get("repository"),
+                "branch": commit.get("branch"),
+            }
+
+
+def _write_records(
+    workbook: Workbook,
+    sheet_name: str,
+    records: Sequence[Dict[str, Any]],
+    *,
+    flatten: bool = False,
+) -> None:
+    """Append ``records`` to a new sheet with a header row of their keys.
+
+    Columns appear in first-seen order. ``records`` is walked twice (once for
+    the header, once for the rows) so no intermediate table is built.
+    """
+
+    sheet = workbook.create_sheet(sheet_name)
+    rows = (_flatten(record) for record in records) if flatten else records
+    columns: Dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    if not columns:
+        return
+
+    header = list(columns)
+    sheet.append(header)
+    rows = (_flatten(record) for record in records) if flatten else records
+    for row in rows:
+        sheet.append([_cell_value(row.get(column)) for column in header])
+
+
+def _flatten(record: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested mappings the way ``pandas.json_normalize`` does."""
+
+    flat: Dict[str, Any] = {}
+    nested: List[tuple[str, Dict[str, Any]]] = []
+    for key, value in record.items():
+        if isinstance(value, dict):
+            nested.append((f"{prefix}{key}.", value))
+        else:
+            flat[f"{prefix}{key}"] = value
+    for nested_prefix, value in nested:
+        flat.update(_flatten(value, nested_prefix))
+    return flat
+
+
+def _cell_value(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, _NATIVE_CELL_TYPES):
+        return value
+    return str(value)
@@ -5,6 +5,10 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
+# Encoder chunks are coalesced into blocks of roughly this many characters
+# before being written.
+_WRITE_BLOCK_SIZE = 64 * 1024
+
 
 class JSONExporter:
     def __init__(self, output_dir: Path) -> None:
@@ -13,6 +17,20 @@ class JSONExporter:
 
     def export(self, data: Dict[str, Any], filename: str = "audit_results.json") -> Path:
         output_path = self.output_dir / filename
+        # ``json.dump`` issues a separate ``write()`` per token (CPython
+        # gh-129711) while ``json.dumps`` holds the whole document in memory.
+        # Stream the encoder output instead and write it in large blocks.
+        encoder = json.JSONEncoder(indent=2)
         with output_path.open("w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2)
+            buffer: list[str] = []
+            size = 0
+            for chunk in encoder.iterencode(data):
+                buffer.append(chunk)
+                size += len(chunk)
+                if size >= _WRITE_BLOCK_SIZE:
+                    fh.write("".join(buffer))
+                    buffer.clear()
+                    size = 0
+            if buffer:
+                fh.write("".join(buffer))
         return output_path
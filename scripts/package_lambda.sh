@@ -8,7 +8,8 @@ rm -rf "$OUT_DIR"
 mkdir -p "$OUT_DIR"
 
 python3 -m pip install --upgrade pip >/dev/null
-python3 -m pip install -r "$ROOT/requirements.txt" -t "$OUT_DIR" >/dev/null
+# Binary-only PyYAML keeps the bundled libyaml (CSafeLoader) in the package.
+python3 -m pip install --only-binary=PyYAML -r "$ROOT/requirements.txt" -t "$OUT_DIR" >/dev/null
 
 cp "$ROOT/main.py" "$OUT_DIR/"
 for path in aws clients config exporters processors; do
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
@@ -21,6 +23,7 @@ REQUIRED_CACHE_FILES = {
     "links": "links.json",
     "summary": "summary.json",
 }
+_REQUIRED_CACHE_ITEMS: tuple[tuple[str, str], ...] = tuple(REQUIRED_CACHE_FILES.items())
 
 
 class AuditInputError(RuntimeError):
@@ -88,24 +91,23 @@ def parse_s3_uri(value: str) -> tuple[str, str]:
     return bucket, prefix
 
 
-def _load_json(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        raise AuditInputError(f"Required cache file not found: {path}")
+def _load_json(path: str) -> Dict[str, Any]:
     try:
-        with path.open("r", encoding="utf-8") as handle:
+        with open(path, "r", encoding="utf-8") as handle:
             return json.load(handle) or {}
+    except FileNotFoundError as exc:
+        raise AuditInputError(f"Required cache file not found: {path}") from exc
     except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
         raise AuditInputError(f"Cache file {path} is not valid JSON") from exc
 
 
 def load_cached_payloads(cache_dir: Path) -> Dict[str, Dict[str, Any]]:
-    cache_dir = cache_dir.resolve()
+    base = str(cache_dir.resolve())
     payloads: Dict[str, Dict[str, Any]] = {}
-    for key, filename in REQUIRED_CACHE_FILES.items():
-        path = cache_dir / filename
-        payload = _load_json(path)
-        payloads[key] = payload
-        LOGGER.debug("Loaded cached payload", extra={"key": key, "path": str(path)})
+    for key, filename in _REQUIRED_CACHE_ITEMS:
+        path = os.path.join(base, filename)
+        payloads[key] = _load_json(path)
+        LOGGER.debug("Loaded cached payload", extra={"key": key, "path": path})
     return payloads
 
 
@@ -124,7 +126,11 @@ def _build_export_payload(payloads: Mapping[str, Mapping[str, Any]]) -> Dict[str
 
 def run_audit(options: AuditOptions) -> AuditResult:
     plan = options.build_plan()
-    LOGGER.info("Starting offline audit", extra={"cache_dir": plan["cache_dir"], "scope": plan["scope"]})
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(
+            "Starting offline audit",
+            extra={"cache_dir": plan["cache_dir"], "scope": plan["scope"]},
+        )
 
     payloads = load_cached_payloads(options.cache_dir)
     payload = _build_export_payload(payloads)
@@ -162,7 +168,11 @@ def run_audit(options: AuditOptions) -> AuditResult:
             extra={"bucket": bucket, "prefix": prefix, "region": options.region},
         )
 
-    LOGGER.info("Offline audit completed", extra={"outputs": {k: str(v) for k, v in outputs.items()}})
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(
+            "Offline audit completed",
+            extra={"outputs": {k: str(v) for k, v in outputs.items()}},
+        )
     return AuditResult(plan=plan, outputs=outputs, uploaded=uploaded)
 
 
@@ -121,11 +121,9 @@ def run_health_command(args: argparse.Namespace, defaults: Defaults) -> int:
 def _resolve_bucket(value: str | None, config: dict) -> tuple[str | None, str | None]:
     if value:
         if value.startswith("s3://"):
-            trimmed = value[5:]
-            if "/" in trimmed:
-                bucket, prefix = trimmed.split("/", 1)
-                return bucket, prefix
-            return trimmed, None
+            _, _, rest = value.partition("s3://")
+            bucket, sep, prefix = rest.partition("/")
+            return bucket, (prefix if sep else None)
         return value, None
 
     bucket, prefix = get_s3_destination(config)
@@ -137,15 +135,8 @@ def _select_secrets(override: str | None, configured: dict[str, str]) -> dict[st
         return dict(configured)
 
     selected: dict[str, str] = {}
-    for entry in override.split(","):
-        name = entry.strip()
-        if not name:
-            continue
-        secret_id = configured.get(name)
-        if secret_id:
-            selected[name] = secret_id
-        else:
-            selected[name] = name
+    for name in filter(None, (entry.strip() for entry in override.split(","))):
+        selected[name] = configured.get(name) or name
     return selected
 
 
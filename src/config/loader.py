@@ -5,14 +5,27 @@ from __future__ import annotations
 import copy
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, Mapping, MutableMapping, Sequence, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, MutableMapping, Sequence, Tuple
 
 import yaml
 
 from clients.secrets_manager import CredentialStore, SecretsManager
 
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional speedup
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    from json import loads as _json_loads
+
 __all__ = [
     "Defaults",
     "load_defaults",
@@ -43,9 +56,10 @@ class Defaults:
     settings_path: Path
     export_formats: tuple[str, ...]
 
-    def as_dict(self) -> dict[str, str]:
-        """Return a serialisable mapping of default paths for introspection."""
-
+    @cached_property
+    def _serialised(self) -> dict[str, str]:
+        # ``cached_property`` writes straight into ``__dict__`` so it remains
+        # compatible with the frozen dataclass.
         return {
             "project_root": str(self.project_root),
             "cache_dir": str(self.cache_dir),
@@ -55,77 +69,193 @@ class Defaults:
             "export_formats": ",".join(self.export_formats),
         }
 
+    def as_dict(self) -> dict[str, str]:
+        """Return a serialisable mapping of default paths for introspection."""
+
+        return dict(self._serialised)
+
 
 def _env(env: Mapping[str, str], key: str, default: str) -> str:
     value = env.get(key)
     return value if value else default
 
 
-def _load_settings_file(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {}
+# Parsed settings files keyed by path and parser. Each entry remembers the
+# ``(st_mtime_ns, st_size)`` signature it was parsed from so edits on disk are
+# picked up; call ``_SETTINGS_CACHE.clear()`` to force a re-read.
+_SETTINGS_CACHE: dict[tuple[str, str], tuple[tuple[int, int], Any]] = {}
+
+
+def _parse_yaml_file(path: Path) -> Any:
+    # The loader accepts UTF-8 bytes directly, so read the file in one call.
+    return yaml.load(path.read_bytes(), Loader=_SafeLoader) or {}
+
+
+def _parse_settings_file(path: Path) -> Any:
     suffix = path.suffix.lower()
     if suffix in {".yaml", ".yml"}:
-        with path.open("r", encoding="utf-8") as handle:
-            return yaml.safe_load(handle) or {}
+        return _parse_yaml_file(path)
     if suffix == ".json":
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _json_loads(path.read_bytes())
     raise ValueError(f"Unsupported configuration format: {path}")
 
 
+def _sidecar_cache_enabled() -> bool:
+    return os.getenv("RC_CONFIG_CACHE", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _load_compiled_settings(
+    path: Path, signature: tuple[int, int], parse: Callable[[Path], Any]
+) -> Any:
+    """Load ``path`` via a ``<name>.cache.json`` sidecar, refreshing it when stale.
+
+    The sidecar records the ``(st_mtime_ns, st_size)`` of the source it was
+    built from, and the parser that produced it, and is only used while both
+    still match, so restoring an older file is picked up too. It is plain JSON, so reading it cannot run
+    code; trees JSON cannot reproduce exactly (dates, non-string keys) are
+    never written to it.
+    """
+
+    sidecar = path.with_name(path.name + ".cache.json")
+    try:
+        compiled = _json_loads(sidecar.read_bytes())
+        if (
+            type(compiled) is dict
+            and compiled.get("signature") == list(signature)
+            and compiled.get("parser") == parse.__name__
+        ):
+            return compiled["data"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    data = parse(path)
+    try:
+        document = json.dumps(
+            {"signature": list(signature), "parser": parse.__name__, "data": data},
+            allow_nan=False,
+        )
+    except (TypeError, ValueError):
+        return data
+    if json.loads(document)["data"] != data:
+        return data
+
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(document, encoding="utf-8")
+        # ``os.replace`` is atomic so concurrent readers never see a torn file.
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        # Read-only deployments (for example Lambda) simply skip the sidecar.
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    return data
+
+
+def _read_settings_file(path: Path, parse: Callable[[Path], Any] | None = None) -> Any:
+    """Return a private copy of ``path`` as parsed by ``parse``.
+
+    ``parse`` defaults to choosing the parser from the file suffix. Raises
+    ``FileNotFoundError`` when the file does not exist.
+    """
+
+    parse = parse or _parse_settings_file
+
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_key = (str(path), parse.__name__)
+    cached = _SETTINGS_CACHE.get(cache_key)
+    if cached is None or cached[0] != signature:
+        if _sidecar_cache_enabled():
+            data = _load_compiled_settings(path, signature, parse)
+        else:
+            data = parse(path)
+        cached = (signature, data)
+        _SETTINGS_CACHE[cache_key] = cached
+    return copy.deepcopy(cached[1])
+
+
+def _load_settings_file(path: Path) -> Dict[str, Any]:
+    try:
+        return _read_settings_file(path)
+    except FileNotFoundError:
+        return {}
+
+
+_EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
+
+
+def _section(config: Any, key: str) -> Mapping[str, Any]:
+    """Return ``config[key]`` when both are mappings, otherwise an empty mapping.
+
+    ``load_config`` always produces plain dicts, so ``type(...) is dict`` is
+    checked before falling back to the slower ``Mapping`` ABC check.
+    """
+
+    if type(config) is not dict and not isinstance(config, Mapping):
+        return _EMPTY_SECTION
+    value = config.get(key)
+    if type(value) is dict or isinstance(value, Mapping):
+        return value
+    return _EMPTY_SECTION
+
+
 def get_aws_region(
     config: Mapping[str, Any], env: Mapping[str, str] | None = None
 ) -> str | None:
     """Return the AWS region derived from configuration or environment."""
 
-    env = env or os.environ
-    aws_config = config.get("aws", {}) if isinstance(config, Mapping) else {}
-    region = aws_config.get("region") if isinstance(aws_config, Mapping) else None
+    region = _section(config, "aws").get("region")
     if region:
         return str(region)
+    env = env or os.environ
     for key in ("AWS_REGION", "AWS_DEFAULT_REGION"):
-        if env.get(key):
-            return env[key]
+        value = env.get(key)
+        if value:
+            return value
     return None
 
 
 def get_s3_destination(config: Mapping[str, Any]) -> Tuple[str | None, str | None]:
     """Return the S3 bucket and prefix configured for artifacts."""
 
-    aws_config = config.get("aws", {}) if isinstance(config, Mapping) else {}
-    bucket = None
-    prefix = None
-    if isinstance(aws_config, Mapping):
-        bucket_value = aws_config.get("s3_bucket")
-        prefix_value = aws_config.get("s3_prefix")
-        bucket = str(bucket_value) if bucket_value else None
-        prefix = str(prefix_value) if prefix_value else None
+    aws_config = _section(config, "aws")
+    bucket_value = aws_config.get("s3_bucket")
+    prefix_value = aws_config.get("s3_prefix")
+    bucket = str(bucket_value) if bucket_value else None
+    prefix = str(prefix_value) if prefix_value else None
     return bucket, prefix
 
 
 def get_dynamodb_table(config: Mapping[str, Any]) -> str | None:
     """Return the DynamoDB table name used for Jira webhook caches."""
 
-    jira_cfg = config.get("jira", {}) if isinstance(config, Mapping) else {}
-    if isinstance(jira_cfg, Mapping):
-        table_name = jira_cfg.get("issue_table_name")
-        return str(table_name) if table_name else None
-    return None
+    table_name = _section(config, "jira").get("issue_table_name")
+    return str(table_name) if table_name else None
 
 
 def get_secrets_mapping(config: Mapping[str, Any]) -> Dict[str, str]:
     """Return the configured Secrets Manager identifiers keyed by logical name."""
 
-    aws_config = config.get("aws", {}) if isinstance(config, Mapping) else {}
-    secrets = aws_config.get("secrets", {}) if isinstance(aws_config, Mapping) else {}
-    if not isinstance(secrets, Mapping):
-        return {}
-    resolved: Dict[str, str] = {}
-    for key, value in secrets.items():
-        if not isinstance(key, str) or not value:
-            continue
-        resolved[key] = str(value)
-    return resolved
+    secrets = _section(_section(config, "aws"), "secrets")
+    return {
+        key: str(value)
+        for key, value in secrets.items()
+        if value and isinstance(key, str)
+    }
+
+
+# Environment variables consulted by ``load_defaults``; only these feed its
+# memoisation key.
+_DEFAULTS_ENV_KEYS = (
+    "RC_ROOT",
+    "RC_CACHE_DIR",
+    "RC_ARTIFACT_DIR",
+    "RC_REPORTS_DIR",
+    "RC_SETTINGS_FILE",
+    "RC_EXPORT_FORMATS",
+)
 
 
 def load_defaults(env: Mapping[str, str] | None = None) -> Defaults:
@@ -134,13 +264,21 @@ def load_defaults(env: Mapping[str, str] | None = None) -> Defaults:
     Environment overrides allow hosted environments (for example Lambda) to
     tailor directory layouts without modifying the CLI logic. Every path is
     resolved to an absolute location to avoid surprises with relative working
-    directories.
+    directories. Results are memoised on the relevant ``RC_*`` values and the
+    working directory; call ``_load_defaults_cached.cache_clear()`` to reset.
     """
 
     env = env or os.environ
-    project_root = Path(
-        _env(env, "RC_ROOT", str(Path(__file__).resolve().parents[2]))
-    ).resolve()
+    values = tuple(env.get(key) for key in _DEFAULTS_ENV_KEYS)
+    return _load_defaults_cached(values, os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _load_defaults_cached(values: tuple[str | None, ...], cwd: str) -> Defaults:
+    # ``cwd`` is only part of the cache key: relative overrides resolve
+    # against it.
+    env = {key: value for key, value in zip(_DEFAULTS_ENV_KEYS, values) if value}
+    project_root = Path(_env(env, "RC_ROOT", str(REPO_ROOT))).resolve()
     cache_dir = Path(
         _env(env, "RC_CACHE_DIR", str(project_root / "temp_data"))
     ).resolve()
@@ -198,8 +336,21 @@ _ENVIRONMENT_PATHS: dict[str, Sequence[str]] = {
     "OAUTH_SECRET_ARN": ("secrets", "jira_oauth", "arn"),
 }
 
+# Upper bound on concurrent Secrets Manager reads while loading configuration.
+_MAX_SECRET_WORKERS = 8
+
 _LIST_ENV_KEYS = {"BITBUCKET_REPOSITORIES", "BITBUCKET_DEFAULT_BRANCHES"}
 _INT_ENV_KEYS = {"JIRA_TOKEN_EXPIRY"}
+_BOOL_ENV_VALUES: dict[str, bool] = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+}
 
 
 _REQUIRED_PATHS: dict[tuple[str, ...], type] = {
@@ -218,33 +369,59 @@ _REQUIRED_PATHS: dict[tuple[str, ...], type] = {
 }
 
 
-def _ensure_mapping(value: Any) -> MutableMapping[str, Any]:
-    if not isinstance(value, Mapping):
-        raise ConfigurationError("Configuration data must be a mapping at every level.")
-    return dict(value)
+def _deep_merge_many(sources: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Merge ``sources`` in a single pass; later sources take precedence.
 
+    Equivalent to folding a pairwise deep merge over ``sources`` but each key is
+    visited once per level; a non-mapping value discards any mappings collected
+    before it. The result shares no mappings or lists with ``sources``: nested
+    mappings are rebuilt even when a single source supplies them, and lists are
+    shallow-copied, so callers may mutate it freely.
+    """
 
-def _deep_merge(base: Mapping[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
-    result: Dict[str, Any] = dict(base)
-    for key, value in override.items():
-        if isinstance(value, Mapping) and isinstance(result.get(key), Mapping):
-            result[key] = _deep_merge(_ensure_mapping(result[key]), value)
-        else:
-            result[key] = value
-    return result
+    merged: Dict[str, Any] = {}
+    chains: Dict[str, list[Mapping[str, Any]]] = {}
+    for source in sources:
+        for key, value in source.items():
+            # ``type(...) is dict`` short-circuits the ABC check for the plain
+            # dicts produced by the parsers.
+            if type(value) is dict or isinstance(value, Mapping):
+                chain = chains.get(key)
+                if chain is not None:
+                    chain.append(value)
+                else:
+                    chains[key] = [value]
+                    # Placeholder that keeps first-seen key order; replaced below.
+                    merged[key] = value
+            else:
+                chains.pop(key, None)
+                merged[key] = list(value) if type(value) is list else value
+    for key, chain in chains.items():
+        merged[key] = _deep_merge_many(chain)
+    return merged
+
+
+def _assign_paths(
+    config: MutableMapping[str, Any],
+    assignments: Iterable[tuple[Sequence[str], Any]],
+) -> None:
+    """Write ``(path, value)`` pairs into ``config``.
 
+    Intermediate mappings are copied the first time they are written through
+    (so shared subtrees are never mutated) and reused for later assignments.
+    """
 
-def _set_path(
-    config: MutableMapping[str, Any], path: Sequence[str], value: Any
-) -> None:
-    cursor: MutableMapping[str, Any] = config
-    for segment in path[:-1]:
-        existing = cursor.get(segment)
-        if not isinstance(existing, Mapping):
-            existing = {}
-        cursor[segment] = dict(existing)
-        cursor = cursor[segment]  # type: ignore[assignment]
-    cursor[path[-1]] = value
+    owned: set[int] = {id(config)}
+    for path, value in assignments:
+        cursor: MutableMapping[str, Any] = config
+        for segment in path[:-1]:
+            existing = cursor.get(segment)
+            if id(existing) not in owned:
+                existing = dict(existing) if isinstance(existing, Mapping) else {}
+                cursor[segment] = existing
+                owned.add(id(existing))
+            cursor = existing  # type: ignore[assignment]
+        cursor[path[-1]] = value
 
 
 def _get_path(config: Mapping[str, Any], path: Sequence[str]) -> Any:
@@ -264,50 +441,88 @@ def _parse_env_value(key: str, value: str) -> Any:
             return int(value)
         except (TypeError, ValueError):
             raise ConfigurationError(f"Environment variable {key} must be an integer.")
-    lowered = value.lower().strip()
-    if lowered in {"true", "1", "yes", "on"}:
-        return True
-    if lowered in {"false", "0", "no", "off"}:
-        return False
-    return value
+    parsed = _BOOL_ENV_VALUES.get(value.lower().strip())
+    return value if parsed is None else parsed
 
 
-def _apply_environment_overrides(
-    config: MutableMapping[str, Any], env: Mapping[str, str]
-) -> None:
-    for env_key, path in _ENVIRONMENT_PATHS.items():
-        if env_key not in env:
-            continue
-        value = _parse_env_value(env_key, env[env_key])
-        _set_path(config, path, value)
+def _environment_snapshot(env: Mapping[str, str] | None) -> Dict[str, str]:
+    """Copy the variables ``load_config`` consults into a plain dict.
 
+    ``os.environ`` encodes and decodes on every access; reading each relevant
+    key once keeps later lookups to ordinary dict hits.
+    """
 
-def _apply_secret_overrides(
-    config: MutableMapping[str, Any],
+    source = env or os.environ
+    return {key: source[key] for key in _ENVIRONMENT_PATHS if key in source}
+
+
+def _environment_overrides(env: Mapping[str, str]) -> list[tuple[Sequence[str], Any]]:
+    return [
+        (path, _parse_env_value(env_key, env[env_key]))
+        for env_key, path in _ENVIRONMENT_PATHS.items()
+        if env_key in env
+    ]
+
+
+def _load_secret_payloads(
+    credential_store: CredentialStore, arns: Sequence[str]
+) -> Dict[str, Mapping[str, Any]]:
+    """Fetch each distinct secret once, fanning out when there are several."""
+
+    unique = list(dict.fromkeys(arns))
+    if len(unique) <= 1:
+        return {arn: credential_store.get_all_from_secret(arn) for arn in unique}
+    workers = min(len(unique), _MAX_SECRET_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(unique, executor.map(credential_store.get_all_from_secret, unique)))
+
+
+def _secret_overrides(
+    config: Mapping[str, Any],
     credential_store: CredentialStore,
-) -> None:
+    shadowed: Callable[[tuple[str, ...]], bool],
+) -> list[tuple[Sequence[str], Any]]:
+    """Return assignments sourced from the configured secrets.
+
+    Secrets are fetched lazily: a secret is only requested when at least one
+    of its mapped paths is not ``shadowed`` by a higher-precedence layer.
+    """
+
     secrets_cfg = config.get("secrets")
     if not isinstance(secrets_cfg, Mapping):
-        return
-    for secret_name, metadata in secrets_cfg.items():
-        if not isinstance(metadata, Mapping):
-            continue
-        arn = metadata.get("arn")
-        if not arn:
-            continue
-        payload = credential_store.get_all_from_secret(arn)
-        if not payload:
+        return []
+    wanted: list[tuple[str, list[tuple[tuple[str, ...], str]]]] = []
+    for metadata in secrets_cfg.values():
+        if not isinstance(metadata, Mapping) or not metadata.get("arn"):
             continue
         values_map = metadata.get("values") or {}
         if not isinstance(values_map, Mapping):
             continue
-        for path_str, key in values_map.items():
-            if not isinstance(path_str, str) or not key:
-                continue
-            if key not in payload:
-                continue
-            path = tuple(path_str.split("."))
-            _set_path(config, path, payload[key])
+        targets = [
+            (path, key)
+            for path, key in (
+                (tuple(path_str.split(".")), key)
+                for path_str, key in values_map.items()
+                if isinstance(path_str, str) and key
+            )
+            if not shadowed(path)
+        ]
+        if targets:
+            wanted.append((metadata["arn"], targets))
+
+    payloads = _load_secret_payloads(credential_store, [arn for arn, _ in wanted])
+    assignments: list[tuple[Sequence[str], Any]] = []
+    for arn, targets in wanted:
+        payload = payloads[arn]
+        if not payload:
+            continue
+        assignments.extend((path, payload[key]) for path, key in targets if key in payload)
+    return assignments
+
+
+def _overrides_leaf(layer: Mapping[str, Any], path: Sequence[str]) -> bool:
+    value = _get_path(layer, path)
+    return value is not None and not isinstance(value, Mapping)
 
 
 def _validate_schema(config: Mapping[str, Any]) -> None:
@@ -342,12 +557,30 @@ def load_config(
         override_path = Path(path)
 
     defaults_file = defaults_path or DEFAULT_CONFIG_PATH
-    with defaults_file.open("r", encoding="utf-8") as handle:
-        raw_defaults = yaml.safe_load(handle) or {}
+    # The defaults file is always YAML-parsed, whatever its suffix.
+    raw_defaults = _read_settings_file(Path(defaults_file), _parse_yaml_file)
     if not isinstance(raw_defaults, Mapping):
         raise ConfigurationError("defaults.yml must contain a mapping at the top level")
 
-    config: MutableMapping[str, Any] = dict(copy.deepcopy(raw_defaults))
+    config: Dict[str, Any] = dict(raw_defaults)
+
+    override_layers: list[Mapping[str, Any]] = []
+    override_file = override_path or DEFAULT_OVERRIDE_PATH
+    if override_file:
+        file_overrides = _load_settings_file(Path(override_file))
+        if file_overrides:
+            override_layers.append(file_overrides)
+    if overrides:
+        override_layers.append(overrides)
+
+    env_map = _environment_snapshot(env)
+    env_assignments = _environment_overrides(env_map)
+    env_paths = {tuple(path) for path, _ in env_assignments}
+
+    def _shadowed(path: tuple[str, ...]) -> bool:
+        return path in env_paths or any(
+            _overrides_leaf(layer, path) for layer in override_layers
+        )
 
     region = _get_path(config, ("aws", "region"))
     secrets_manager = credential_store
@@ -357,20 +590,18 @@ def load_config(
         )
         secrets_manager = CredentialStore(secrets_manager=sm_client)
 
-    _apply_secret_overrides(config, secrets_manager)
+    # Environment values are listed after secrets so they win on conflicts.
+    assignments = _secret_overrides(config, secrets_manager, _shadowed)
+    assignments.extend(env_assignments)
+    _assign_paths(config, assignments)
 
-    env_map = env or os.environ
-    _apply_environment_overrides(config, env_map)
-
-    file_overrides: Mapping[str, Any] = {}
-    override_file = override_path or DEFAULT_OVERRIDE_PATH
-    if override_file and Path(override_file).exists():
-        file_overrides = _load_settings_file(Path(override_file))
-        if file_overrides:
-            config = _deep_merge(config, file_overrides)
-
-    if overrides:
-        config = _deep_merge(config, overrides)
+    layers: list[Mapping[str, Any]] = [config, *override_layers]
+    if len(layers) > 1:
+        config = _deep_merge_many(layers)
 
     _validate_schema(config)
-    return dict(config)
+    # No final deepcopy: without overrides ``config`` is the private copy
+    # ``_read_settings_file`` handed out (``_assign_paths`` copies what it writes
+    # through), and with overrides ``_deep_merge_many`` rebuilds every mapping
+    # and list, so nothing returned is shared with caches or caller input.
+    return config
@@ -2,14 +2,56 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Set
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Mapping as TypingMapping
 
-from exporters.excel_exporter import ExcelExporter
 from exporters.json_exporter import JSONExporter
 
-_SUPPORTED_FORMATS = {"json", "excel"}
+_SUPPORTED_FORMATS: frozenset[str] = frozenset({"json", "excel"})
+
+
+@lru_cache(maxsize=8)
+def _get_exporter(fmt: str, output_dir: Path) -> Any:
+    """Return a reusable exporter for ``fmt`` writing into ``output_dir``.
+
+    The Excel exporter pulls in pandas/openpyxl, so it is only imported the
+    first time an Excel export is actually requested.
+    """
+
+    if fmt == "excel":
+        from exporters.excel_exporter import ExcelExporter
+
+        return ExcelExporter(output_dir)
+    return JSONExporter(output_dir)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialise ``obj`` as indented JSON bytes with the stdlib encoder.
+
+    The summary is small, so the stdlib encoder is used unconditionally and the
+    file keeps exactly the formatting of ``json.dumps(obj, indent=2)``.
+    """
+
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _as_list(items: Iterable[Dict[str, Any]] | None) -> list[Dict[str, Any]]:
+    """Return ``items`` as a list, reusing it when it already is one."""
+
+    if items is None:
+        return []
+    if type(items) is list:
+        return items
+    return list(items)
+
+
+def _write_json(path: Path, obj: Any) -> Path:
+    """Write ``obj`` to ``path`` in one buffered call rather than via ``json.dump``."""
+
+    path.write_bytes(_json_dumps(obj))
+    return path
 
 
 def build_export_payload(
@@ -26,6 +68,9 @@ def build_export_payload(
     canonical keys (``summary``, ``stories_with_no_commits``,
     ``orphan_commits`` and ``commit_story_mapping``) or the individual pieces
     which are then merged into the expected structure.
+
+    List inputs are reused rather than copied, so callers should not mutate
+    them after building the payload.
     """
 
     if data is not None and any(item is not None for item in (matched, missing, orphans, summary)):
@@ -34,29 +79,29 @@ def build_export_payload(
     if data is None:
         payload_source: Mapping[str, Any] = {
             "summary": dict(summary or {}),
-            "stories_with_no_commits": list(missing or []),
-            "orphan_commits": list(orphans or []),
-            "commit_story_mapping": list(matched or []),
+            "stories_with_no_commits": _as_list(missing),
+            "orphan_commits": _as_list(orphans),
+            "commit_story_mapping": _as_list(matched),
         }
     else:
         payload_source = data
 
     return {
         "summary": dict(payload_source.get("summary", {})),
-        "stories_with_no_commits": list(payload_source.get("stories_with_no_commits", []) or []),
-        "orphan_commits": list(payload_source.get("orphan_commits", []) or []),
-        "commit_story_mapping": list(payload_source.get("commit_story_mapping", []) or []),
+        "stories_with_no_commits": _as_list(payload_source.get("stories_with_no_commits") or []),
+        "orphan_commits": _as_list(payload_source.get("orphan_commits") or []),
+        "commit_story_mapping": _as_list(payload_source.get("commit_story_mapping") or []),
     }
 
 
-def _normalise_formats(formats: Iterable[str] | None) -> set[str]:
+def _normalise_formats(formats: Iterable[str] | None) -> Set[str]:
     if formats is None:
-        return set(_SUPPORTED_FORMATS)
+        return _SUPPORTED_FORMATS
     requested = {fmt.strip().lower() for fmt in formats if fmt}
     invalid = requested - _SUPPORTED_FORMATS
     if invalid:
         raise ValueError(f"Unsupported export formats requested: {sorted(invalid)}")
-    return requested or set(_SUPPORTED_FORMATS)
+    return requested or _SUPPORTED_FORMATS
 
 
 def export_all(
@@ -112,16 +157,14 @@ def export_all(
 
     if "json" in requested_formats:
         json_path = resolved["json"]
-        json_exporter = JSONExporter(json_path.parent)
-        outputs["json"] = json_exporter.export(payload, json_path.name)
+        outputs["json"] = _get_exporter("json", json_path.parent).export(payload, json_path.name)
     if "excel" in requested_formats:
         excel_path = resolved["excel"]
-        excel_exporter = ExcelExporter(excel_path.parent)
-        outputs["excel"] = excel_exporter.export(payload, excel_path.name)
+        outputs["excel"] = _get_exporter("excel", excel_path.parent).export(
+            payload, excel_path.name
+        )
 
-    summary_path = resolved["summary"]
-    summary_path.write_text(json.dumps(payload["summary"], indent=2), encoding="utf-8")
-    outputs["summary"] = summary_path
+    outputs["summary"] = _write_json(resolved["summary"], payload["summary"])
 
     return outputs
 
@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Mapping, MutableMapping
+from functools import cached_property, lru_cache
+from secrets import token_hex
+from typing import Any, Dict, Mapping, MutableMapping, Tuple
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
 from releasecopilot.logging_config import get_logger
@@ -17,6 +20,13 @@ LOGGER = get_logger(__name__)
 
 HEALTH_VERSION = "health.v1"
 
+# Shared by every readiness client: a larger pool covers the concurrent probes
+# and adaptive retries back off when AWS throttles.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
 
 @dataclass(frozen=True)
 class ReadinessClients:
@@ -41,6 +51,17 @@ class ReadinessOptions:
     dry_run: bool = False
     clients: ReadinessClients | None = None
 
+    @cached_property
+    def secrets_resource(self) -> str:
+        """Return the ``name=secret_id`` listing used in secrets check results."""
+
+        # Plain dicts already iterate in a deterministic (insertion) order;
+        # only other mapping types need sorting for a stable string.
+        items = self.secrets.items()
+        if not isinstance(self.secrets, dict):
+            items = sorted(items)
+        return ", ".join(f"{name}={secret_id}" for name, secret_id in items)
+
 
 @dataclass
 class CheckResult:
@@ -92,15 +113,26 @@ class ReadinessReport:
 def run_readiness(options: ReadinessOptions) -> ReadinessReport:
     """Execute readiness checks returning a structured report."""
 
-    timestamp = datetime.now(timezone.utc).isoformat()
+    # Wall-clock start of the run; second precision matches the documented
+    # report examples and keeps reports stable to diff.
+    timestamp = datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat(timespec="seconds")
     clients = options.clients or _build_clients(options.region)
     cleanup_messages: list[str] = []
-
-    secret_result, secret_state = _check_secrets(options, clients)
-    dynamo_result, dynamo_warning = _check_dynamodb(options, clients)
+    # One random id per run names both sentinels, so they are easy to
+    # correlate in logs and cost a single urandom read.
+    run_id = token_hex(8)
+
+    # The secrets, DynamoDB and S3 probes hit independent endpoints, so run
+    # them concurrently; the webhook check reuses the secrets outcome.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        secrets_future = executor.submit(_check_secrets, options, clients)
+        dynamo_future = executor.submit(_check_dynamodb, options, clients, run_id)
+        s3_future = executor.submit(_check_s3, options, clients, run_id)
+        secret_result, secret_state = secrets_future.result()
+        dynamo_result, dynamo_warning = dynamo_future.result()
+        s3_result, s3_warning = s3_future.result()
     if dynamo_warning:
         cleanup_messages.append(dynamo_warning)
-    s3_result, s3_warning = _check_s3(options, clients)
     if s3_warning:
         cleanup_messages.append(s3_warning)
     webhook_result = _check_webhook(options, clients, secret_state)
@@ -129,11 +161,20 @@ def run_readiness(options: ReadinessOptions) -> ReadinessReport:
     return report
 
 
+@lru_cache(maxsize=1)
+def _session() -> boto3.session.Session:
+    return boto3.session.Session()
+
+
+@lru_cache(maxsize=8)
 def _build_clients(region: str | None) -> ReadinessClients:
+    # Client construction loads and compiles service models, so reuse the
+    # clients for repeated readiness runs against the same region.
+    session = _session()
     return ReadinessClients(
-        secrets=boto3.client("secretsmanager", region_name=region),
-        dynamodb=boto3.client("dynamodb", region_name=region),
-        s3=build_s3_client(region_name=region),
+        secrets=session.client("secretsmanager", region_name=region, config=_CLIENT_CONFIG),
+        dynamodb=session.client("dynamodb", region_name=region, config=_CLIENT_CONFIG),
+        s3=build_s3_client(region_name=region, session=session, config=_CLIENT_CONFIG),
     )
 
 
@@ -144,9 +185,7 @@ def _check_secrets(
     if not options.secrets:
         return CheckResult("pass", resource="secretsmanager://none", reason="No secrets requested"), secret_status
 
-    resource = ", ".join(
-        f"{name}={secret_id}" for name, secret_id in sorted(options.secrets.items())
-    )
+    resource = options.secrets_resource
     if options.dry_run:
         LOGGER.info("Skipping secrets check (dry-run)", extra={"secrets": list(options.secrets.keys())})
         for secret_id in options.secrets.values():
@@ -156,22 +195,31 @@ def _check_secrets(
             secret_status,
         )
 
+    batched = _batch_secret_outcomes(clients.secrets, list(options.secrets.values()))
     failures: list[str] = []
     for name, secret_id in options.secrets.items():
-        try:
-            response = clients.secrets.get_secret_value(SecretId=secret_id)
-        except (BotoCoreError, ClientError) as exc:
+        error: str | None = None
+        if secret_id in batched:
+            outcome, error = batched[secret_id]
+        else:
+            try:
+                response = clients.secrets.get_secret_value(SecretId=secret_id)
+            except (BotoCoreError, ClientError) as exc:
+                outcome, error = exc.__class__.__name__, str(exc)
+            else:
+                outcome = _has_secret_payload(response)
+
+        if isinstance(outcome, str):
             LOGGER.error(
                 "Failed to read secret",
-                extra={"secret_name": name, "secret_id": secret_id, "error": str(exc)},
+                extra={"secret_name": name, "secret_id": secret_id, "error": error},
             )
-            failures.append(f"{name}: unable to read secret ({exc.__class__.__name__})")
+            failures.append(f"{name}: unable to read secret ({outcome})")
             secret_status[secret_id] = False
             continue
 
-        has_payload = bool(response.get("SecretString") or response.get("SecretBinary"))
-        secret_status[secret_id] = has_payload
-        if not has_payload:
+        secret_status[secret_id] = outcome
+        if not outcome:
             LOGGER.error(
                 "Secret payload was empty",
                 extra={"secret_name": name, "secret_id": secret_id},
@@ -188,6 +236,55 @@ def _check_secrets(
     return CheckResult(status, resource=f"secretsmanager://{resource}", reason=reason), secret_status
 
 
+# BatchGetSecretValue accepts at most this many identifiers per request.
+_SECRET_BATCH_SIZE = 20
+
+
+def _has_secret_payload(entry: Mapping[str, Any]) -> bool:
+    return bool(entry.get("SecretString") or entry.get("SecretBinary"))
+
+
+def _batch_secret_outcomes(
+    client: Any, secret_ids: list[str]
+) -> Dict[str, Tuple[bool | str, str | None]]:
+    """Resolve several secrets with ``BatchGetSecretValue``.
+
+    Maps each requested identifier to an ``(outcome, error)`` pair: the outcome
+    is whether the secret carries a payload, or the error code reported for
+    it, and ``error`` is the accompanying error message (``None`` on success).
+    Identifiers missing from the result (for example when the caller lacks
+    ``secretsmanager:BatchGetSecretValue``) are left for the per-secret
+    fallback.
+    """
+
+    unique = list(dict.fromkeys(secret_ids))
+    outcomes: Dict[str, Tuple[bool | str, str | None]] = {}
+    if len(unique) < 2:
+        return outcomes
+
+    for start in range(0, len(unique), _SECRET_BATCH_SIZE):
+        chunk = unique[start : start + _SECRET_BATCH_SIZE]
+        try:
+            response = client.batch_get_secret_value(SecretIdList=chunk)
+        except (BotoCoreError, ClientError) as exc:
+            LOGGER.warning(
+                "Batch secret read failed; falling back to individual reads",
+                extra={"error": str(exc)},
+            )
+            continue
+        requested = set(chunk)
+        for entry in response.get("SecretValues") or []:
+            for identifier in (entry.get("ARN"), entry.get("Name")):
+                if identifier in requested:
+                    outcomes[identifier] = (_has_secret_payload(entry), None)
+        for error in response.get("Errors") or []:
+            identifier = error.get("SecretId")
+            if identifier in requested:
+                code = error.get("ErrorCode") or "UnknownError"
+                outcomes[identifier] = (code, error.get("Message") or code)
+    return outcomes
+
+
 def _check_webhook(
     options: ReadinessOptions,
     clients: ReadinessClients,
@@ -220,8 +317,7 @@ def _check_webhook(
         )
         return CheckResult("fail", resource=f"secretsmanager://{secret_id}", reason="Unable to fetch webhook secret")
 
-    has_payload = bool(response.get("SecretString") or response.get("SecretBinary"))
-    if not has_payload:
+    if not _has_secret_payload(response):
         LOGGER.error(
             "Webhook secret payload empty",
             extra={"secret_id": secret_id},
@@ -232,7 +328,7 @@ def _check_webhook(
 
 
 def _check_dynamodb(
-    options: ReadinessOptions, clients: ReadinessClients
+    options: ReadinessOptions, clients: ReadinessClients, run_id: str
 ) -> tuple[CheckResult, str | None]:
     table_name = options.table_name
     if not table_name:
@@ -244,7 +340,7 @@ def _check_dynamodb(
 
     client = clients.dynamodb
     try:
-        description = client.describe_table(TableName=table_name)["Table"]
+        key_schema, attr_defs = _table_schema(client, table_name)
     except (BotoCoreError, ClientError) as exc:
         LOGGER.error(
             "Failed to describe DynamoDB table",
@@ -255,8 +351,6 @@ def _check_dynamodb(
             None,
         )
 
-    key_schema = description.get("KeySchema") or []
-    attr_defs = {definition["AttributeName"]: definition["AttributeType"] for definition in description.get("AttributeDefinitions", [])}
     if not key_schema:
         LOGGER.error("Table key schema missing", extra={"table_name": table_name})
         return (
@@ -264,17 +358,31 @@ def _check_dynamodb(
             None,
         )
 
-    sentinel = f"rc-health-{uuid.uuid4().hex}"
+    sentinel = f"rc-health-{run_id}-ddb"
     item: Dict[str, Dict[str, str]] = {}
     for element in key_schema:
         name = element.get("AttributeName")
         attr_type = attr_defs.get(name, "S")
         item[name] = _ddb_attribute(attr_type, sentinel)
 
+    # When the table expires items via TTL the sentinel is written with an
+    # expiry and left for DynamoDB to remove, saving the DeleteItem call.
+    ttl_attribute = _ttl_attribute(client, table_name)
+    if ttl_attribute in item:
+        ttl_attribute = None
+    put_item = dict(item)
+    if ttl_attribute:
+        put_item[ttl_attribute] = {"N": str(int(time.time()) + _SENTINEL_TTL_SECONDS)}
+
     try:
-        client.put_item(TableName=table_name, Item=item)
+        client.put_item(TableName=table_name, Item=put_item)
         LOGGER.info("Wrote DynamoDB sentinel item", extra={"table_name": table_name})
     except (BotoCoreError, ClientError) as exc:
+        error_code = exc.response.get("Error", {}).get("Code") if isinstance(exc, ClientError) else None
+        if error_code == "ResourceNotFoundException":
+            # The table was dropped or recreated; describe it afresh next run.
+            _table_schema.cache_clear()
+            _ttl_attribute.cache_clear()
         LOGGER.error(
             "Failed to write DynamoDB sentinel item",
             extra={"table_name": table_name, "error": str(exc)},
@@ -284,6 +392,9 @@ def _check_dynamodb(
             None,
         )
 
+    if ttl_attribute:
+        return CheckResult("pass", resource=f"dynamodb://{table_name}"), None
+
     cleanup_warning: str | None = None
     try:
         client.delete_item(TableName=table_name, Key=item)
@@ -299,6 +410,47 @@ def _check_dynamodb(
     return CheckResult("pass", resource=f"dynamodb://{table_name}"), cleanup_warning
 
 
+@lru_cache(maxsize=32)
+def _table_schema(
+    client: Any, table_name: str
+) -> tuple[tuple[Mapping[str, Any], ...], Mapping[str, str]]:
+    """Return the key schema and attribute types of ``table_name``.
+
+    Table schemas do not change within a process, so ``DescribeTable`` is only
+    called on the first readiness run for each client and table.
+    """
+
+    description = client.describe_table(TableName=table_name)["Table"]
+    key_schema = tuple(description.get("KeySchema") or ())
+    attr_defs = {
+        definition["AttributeName"]: definition["AttributeType"]
+        for definition in description.get("AttributeDefinitions", [])
+    }
+    return key_schema, attr_defs
+
+
+# Lifetime of self-expiring DynamoDB sentinels on TTL-enabled tables.
+_SENTINEL_TTL_SECONDS = 300
+
+
+@lru_cache(maxsize=32)
+def _ttl_attribute(client: Any, table_name: str) -> str | None:
+    """Return the enabled TTL attribute for ``table_name``, if any."""
+
+    try:
+        description = client.describe_time_to_live(TableName=table_name)
+    except (BotoCoreError, ClientError) as exc:
+        LOGGER.debug(
+            "Unable to read DynamoDB TTL settings",
+            extra={"table_name": table_name, "error": str(exc)},
+        )
+        return None
+    ttl = description.get("TimeToLiveDescription") or {}
+    if ttl.get("TimeToLiveStatus") != "ENABLED":
+        return None
+    return ttl.get("AttributeName") or None
+
+
 def _ddb_attribute(attr_type: str, sentinel: str) -> Dict[str, str]:
     if attr_type == "N":
         return {"N": str(int(time.time()))}
@@ -308,7 +460,7 @@ def _ddb_attribute(attr_type: str, sentinel: str) -> Dict[str, str]:
 
 
 def _check_s3(
-    options: ReadinessOptions, clients: ReadinessClients
+    options: ReadinessOptions, clients: ReadinessClients, run_id: str
 ) -> tuple[CheckResult, str | None]:
     bucket = options.bucket
     if not bucket:
@@ -321,7 +473,7 @@ def _check_s3(
         return CheckResult("pass", resource=resource, reason="Dry-run"), None
 
     client = clients.s3
-    sentinel = uuid.uuid4().hex
+    sentinel = f"{run_id}-s3"
     key_parts = [part for part in (prefix, "health", "readiness", f"{sentinel}.txt") if part]
     key = "/".join(key_parts)
     resource = f"s3://{bucket}/{key}"
@@ -1,40 +1,87 @@
 """Minimal AWS Secrets Manager helper."""
 from __future__ import annotations
 
+import threading
 from functools import lru_cache
+from time import monotonic as _monotonic
 from typing import Optional
 
-try:
-    import boto3
-    from botocore.exceptions import BotoCoreError, ClientError
-except Exception:  # pragma: no cover - boto3 is an optional dependency at test time
-    boto3 = None  # type: ignore[assignment]
-    BotoCoreError = ClientError = Exception  # type: ignore[assignment]
-
 
 @lru_cache(maxsize=None)
 def _client():  # pragma: no cover - exercised via get_secret
-    if boto3 is None:  # pragma: no cover - defensive; boto3 is expected
-        raise RuntimeError("boto3 is required to access AWS Secrets Manager")
+    # boto3 is imported on first use so configuration paths that never touch
+    # Secrets Manager do not pay for loading botocore.
+    try:
+        import boto3
+    except ImportError as exc:  # pragma: no cover - boto3 is an optional dependency
+        raise RuntimeError("boto3 is required to access AWS Secrets Manager") from exc
     return boto3.client("secretsmanager")
 
 
-@lru_cache(maxsize=None)
+# Names whose last lookup failed, mapped to the monotonic time after which
+# they may be fetched again. Insertion order is expiry order because the TTL
+# is fixed, so the oldest entry is evicted first once the cap is reached.
+_MISSING_UNTIL: dict[str, float] = {}
+# Secrets may be fetched from worker threads; the lock keeps pruning and
+# eviction from racing with concurrent inserts.
+_MISSING_LOCK = threading.Lock()
+_NEGATIVE_TTL_SECONDS = 60.0
+_MAX_MISSING = 128
+
+
+class _SecretUnavailable(Exception):
+    """Raised internally so ``lru_cache`` never memoises a failed lookup."""
+
+
 def get_secret(name: str) -> Optional[str]:
-    """Fetch ``name`` from AWS Secrets Manager, caching the result."""
+    """Fetch ``name`` from AWS Secrets Manager, caching the result.
+
+    Successful lookups are kept in a bounded LRU cache. Failed lookups are
+    remembered (at most :data:`_MAX_MISSING` of them) for
+    :data:`_NEGATIVE_TTL_SECONDS` and then retried.
+    """
 
     if not name:
         return None
 
+    retry_at = _MISSING_UNTIL.get(name)
+    if retry_at is not None:
+        if _monotonic() < retry_at:
+            return None
+        with _MISSING_LOCK:
+            # Another thread may already have dropped the expired entry.
+            _MISSING_UNTIL.pop(name, None)
+
+    try:
+        return _fetch_secret(name)
+    except _SecretUnavailable:
+        _remember_missing(name)
+        return None
+
+
+def _remember_missing(name: str) -> None:
+    with _MISSING_LOCK:
+        now = _monotonic()
+        for stale in [key for key, retry_at in _MISSING_UNTIL.items() if retry_at <= now]:
+            _MISSING_UNTIL.pop(stale, None)
+        while len(_MISSING_UNTIL) >= _MAX_MISSING:
+            _MISSING_UNTIL.pop(next(iter(_MISSING_UNTIL)), None)
+        _MISSING_UNTIL[name] = now + _NEGATIVE_TTL_SECONDS
+
+
+@lru_cache(maxsize=128)
+def _fetch_secret(name: str) -> str:
     try:
         client = _client()
     except Exception:  # pragma: no cover - client creation errors are propagated
-        return None
+        raise _SecretUnavailable(name)
+
+    from botocore.exceptions import BotoCoreError, ClientError
 
     try:
         response = client.get_secret_value(SecretId=name)
     except (ClientError, BotoCoreError):
-        return None
+        raise _SecretUnavailable(name)
 
     secret = response.get("SecretString")
     if secret is not None:
@@ -45,6 +92,6 @@ def get_secret(name: str) -> Optional[str]:
         try:
             return binary_secret.decode("utf-8")
         except Exception:  # pragma: no cover - unexpected encoding issues
-            return None
+            raise _SecretUnavailable(name)
 
-    return None
+    raise _SecretUnavailable(name)
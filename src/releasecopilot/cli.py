@@ -82,11 +82,15 @@ def _create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# ``ArgumentParser.parse_args`` does not mutate the parser, so a single
+# instance is built at import time and reused for every invocation.
+_PARSER = _create_parser()
+
+
 def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
     """Parse CLI arguments into a namespace."""
 
-    parser = _create_parser()
-    return parser.parse_args(argv)
+    return _PARSER.parse_args(argv)
 
 
 def run(argv: Optional[Iterable[str]] = None) -> dict:
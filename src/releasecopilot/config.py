@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import argparse
+import copy
+import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable
 
@@ -10,6 +13,13 @@ import yaml
 
 from . import aws_secrets
 
+logger = logging.getLogger(__name__)
+
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 # Keys that the configuration system understands by default. Additional keys
 # discovered in the YAML file will also be considered for environment
 # overrides.
@@ -27,7 +37,11 @@ KNOWN_CONFIG_KEYS: set[str] = {
 
 # Keys that should be interpreted as booleans when sourced from the
 # environment.
-BOOLEAN_KEYS = {"use_aws_secrets_manager"}
+BOOLEAN_KEYS = frozenset({"use_aws_secrets_manager"})
+
+# Accepted spellings for boolean environment values.
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+_FALSY = frozenset({"0", "false", "no", "off", "n", "f"})
 
 # Common prefixes that may be used for environment variables. The empty string
 # allows direct lookups (e.g. ``JIRA_TOKEN``) while the others support names
@@ -59,11 +73,12 @@ def load_yaml_defaults(path: str | Path | None) -> dict:
         return {}
 
     yaml_path = Path(path)
-    if not yaml_path.exists():
+    try:
+        stat = yaml_path.stat()
+    except FileNotFoundError:
         return {}
 
-    with yaml_path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+    data = _parse_yaml(str(yaml_path), stat.st_mtime_ns, stat.st_size)
 
     if not isinstance(data, dict):
         raise ConfigError(
@@ -71,20 +86,43 @@ def load_yaml_defaults(path: str | Path | None) -> dict:
             f" but received {type(data).__name__}."
         )
 
-    return data
+    # The parsed document is shared through the cache; hand out a copy.
+    return copy.deepcopy(data)
+
+
+@lru_cache(maxsize=16)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    # ``mtime_ns`` and ``size`` only key the cache so edited files are reparsed.
+    with open(path, "rb") as handle:
+        return yaml.load(handle, Loader=_SafeLoader) or {}
 
 
 def _coerce_bool(value: str) -> bool:
-    truthy = {"1", "true", "yes", "on", "y", "t"}
-    falsy = {"0", "false", "no", "off", "n", "f"}
     lowered = value.strip().lower()
-    if lowered in truthy:
+    if lowered in _TRUTHY:
         return True
-    if lowered in falsy:
+    if lowered in _FALSY:
         return False
     raise ConfigError(f"Unable to interpret boolean value from '{value}'.")
 
 
+def _build_env_probes(keys: Iterable[str]) -> Dict[str, tuple[tuple[int, str], ...]]:
+    """Map each accepted variable name to the ``(prefix rank, key)`` pairs it feeds.
+
+    The rank keeps an unprefixed variable ahead of the prefixed spellings.
+    """
+
+    probes: Dict[str, list[tuple[int, str]]] = {}
+    for key in keys:
+        upper = key.upper()
+        for rank, prefix in enumerate(ENV_PREFIXES):
+            probes.setdefault(f"{prefix}{upper}", []).append((rank, key))
+    return {name: tuple(entries) for name, entries in probes.items()}
+
+
+_KNOWN_ENV_PROBES = _build_env_probes(sorted(KNOWN_CONFIG_KEYS))
+
+
 def load_env_overrides(keys: Iterable[str]) -> dict:
     """Return environment overrides for ``keys``.
 
@@ -93,21 +131,27 @@ def load_env_overrides(keys: Iterable[str]) -> dict:
     registered in :data:`BOOLEAN_KEYS` are parsed into booleans.
     """
 
+    key_list = list(keys)
+    # Known keys use the table built at import; only keys discovered in the
+    # YAML file need probes computed here. Entries for known keys that were
+    # not requested are harmless because results are filtered by ``key_list``.
+    extra_probes = _build_env_probes(key for key in key_list if key not in KNOWN_CONFIG_KEYS)
+
+    found: Dict[str, tuple[int, str]] = {}
+    for env_name, env_value in os.environ.items():
+        candidates = _KNOWN_ENV_PROBES.get(env_name, ())
+        if extra_probes:
+            candidates = (*candidates, *extra_probes.get(env_name, ()))
+        for rank, key in candidates:
+            best = found.get(key)
+            if best is None or rank < best[0]:
+                found[key] = (rank, env_value)
+
     overrides: Dict[str, Any] = {}
-    for key in keys:
-        candidates = [key, key.upper()]
-        env_value = None
-        for candidate in candidates:
-            for prefix in ENV_PREFIXES:
-                env_key = f"{prefix}{candidate.upper()}"
-                if env_key in os.environ:
-                    env_value = os.environ[env_key]
-                    break
-            if env_value is not None:
-                break
-        if env_value is None:
+    for key in key_list:
+        if key not in found:
             continue
-
+        env_value = found[key][1]
         if key in BOOLEAN_KEYS:
             overrides[key] = _coerce_bool(env_value)
         else:
@@ -127,31 +171,57 @@ def merge_configs(*dicts: Dict[str, Any]) -> dict:
     return merged
 
 
+def _lower_keys(mapping: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Return ``mapping`` with string keys lower-cased.
+
+    Keys that are already lower case win over differently cased duplicates,
+    mirroring the order in which secrets used to be probed.
+    """
+
+    normalised: Dict[Any, Any] = {}
+    pending: list[tuple[str, Any]] = []
+    for key, value in mapping.items():
+        if isinstance(key, str) and key != key.lower():
+            pending.append((key, value))
+        else:
+            normalised[key] = value
+    for key, value in pending:
+        lowered = key.lower()
+        if lowered in normalised:
+            logger.debug("Ignoring configuration key %s; %s is already set", key, lowered)
+            continue
+        normalised[lowered] = value
+    return normalised
+
+
 def resolve_secret(name: str, cfg: Dict[str, Any]) -> str | None:
-    """Resolve ``name`` within ``cfg`` respecting secret precedence."""
+    """Resolve ``name`` within ``cfg`` respecting secret precedence.
+
+    ``cfg`` is expected to use lower-case keys, as produced by
+    :func:`build_config`.
+    """
 
     if not name:
         raise ValueError("Secret name must be provided.")
     if cfg is None:
         raise ValueError("Configuration dictionary is required.")
 
-    for candidate in (name, name.lower(), name.upper()):
-        value = cfg.get(candidate)
-        if value:
-            return value
+    key = name.lower()
+    value = cfg.get(key)
+    if value:
+        return value
 
     secrets = cfg.get("secrets")
     if isinstance(secrets, dict):
-        for candidate in (name, name.lower(), name.upper()):
-            value = secrets.get(candidate)
-            if value:
-                cfg[name] = value
-                return value
+        value = secrets.get(key)
+        if value:
+            cfg[key] = value
+            return value
 
     if cfg.get("use_aws_secrets_manager"):
         secret = aws_secrets.get_secret(name)
         if secret:
-            cfg[name] = secret
+            cfg[key] = secret
             return secret
 
     return None
@@ -195,7 +265,9 @@ def build_config(cli_args: argparse.Namespace) -> dict:
     env_overrides = load_env_overrides(env_keys)
     cli_overrides = _extract_cli_overrides(cli_args)
 
-    merged = merge_configs(cli_overrides, env_overrides, yaml_defaults)
+    merged = _lower_keys(merge_configs(cli_overrides, env_overrides, yaml_defaults))
+    if isinstance(merged.get("secrets"), dict):
+        merged["secrets"] = _lower_keys(merged["secrets"])
     if config_path:
         merged["config_path"] = str(config_path)
 
@@ -4,26 +4,90 @@ from __future__ import annotations
 import json
 import logging
 import os
+import re
 import sys
 import threading
 import uuid
+from contextvars import ContextVar, Token
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from typing import Any, Iterable
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
 
 
 _CONFIG_LOCK = threading.Lock()
 _CONFIGURED = False
-_CORRELATION_ID = os.getenv("RC_CORR_ID") or str(uuid.uuid4())
+# Unset unless a caller scopes an identifier to the current context (e.g. one
+# request in a server); otherwise the run-wide default below applies, which
+# also covers worker threads that start with an empty context.
+_CORRELATION_ID_VAR: ContextVar[str] = ContextVar("rc_correlation_id")
 
 _SENSITIVE_KEYS = {"token", "secret", "password", "key", "authorization"}
 _SENSITIVE_PATTERNS = tuple(value.lower() for value in _SENSITIVE_KEYS)
+# One case-insensitive alternation scans a string once instead of lower-casing
+# it and searching for each pattern in turn.
+_SECRET_RE = re.compile("|".join(map(re.escape, _SENSITIVE_PATTERNS)), re.IGNORECASE)
+
+
+# LogRecord attributes that are either folded into the fixed payload fields
+# or not useful in structured output.
+_SKIP_ATTRS = frozenset(
+    {
+        "args",
+        "msg",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+    }
+)
+
+
+@lru_cache(maxsize=1)
+def _default_correlation_id() -> str:
+    return os.getenv("RC_CORR_ID") or str(uuid.uuid4())
 
 
 def get_correlation_id() -> str:
-    """Return the run-scoped correlation identifier."""
+    """Return the correlation identifier for the current context.
 
-    return _CORRELATION_ID
+    Falls back to the run-scoped identifier, which is created on first use.
+    """
+
+    try:
+        return _CORRELATION_ID_VAR.get()
+    except LookupError:
+        return _default_correlation_id()
+
+
+def set_correlation_id(value: str) -> Token[str]:
+    """Scope ``value`` as the correlation identifier for the current context.
+
+    Returns a token that can be passed to ``ContextVar.reset`` via
+    :func:`reset_correlation_id`.
+    """
+
+    return _CORRELATION_ID_VAR.set(value)
+
+
+def reset_correlation_id(token: Token[str]) -> None:
+    """Restore the correlation identifier that was active before ``token``."""
+
+    _CORRELATION_ID_VAR.reset(token)
 
 
 class _CorrelationIdFilter(logging.Filter):
@@ -31,28 +95,93 @@ class _CorrelationIdFilter(logging.Filter):
 
     def filter(self, record: logging.LogRecord) -> bool:  # noqa: D401
         if not hasattr(record, "correlation_id") or not record.correlation_id:
-            record.correlation_id = _CORRELATION_ID
+            record.correlation_id = get_correlation_id()
         return True
 
 
 def _contains_secret(value: str) -> bool:
-    lowered = value.lower()
-    return any(token in lowered for token in _SENSITIVE_PATTERNS)
+    return _SECRET_RE.search(value) is not None
+
+
+def _needs_redact(value: Any) -> bool:
+    """Return ``True`` when :func:`_redact` would change ``value``.
+
+    Walks the structure read-only and stops at the first hit, so clean log
+    context is passed through without being copied. Each container is visited
+    once, so self-referencing context cannot stall the walk.
+    """
+
+    pending = [value]
+    seen: set[int] = set()
+    while pending:
+        item = pending.pop()
+        if isinstance(item, str):
+            if _contains_secret(item):
+                return True
+        elif isinstance(item, (dict, list, tuple, set)):
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            pending.extend(item.values() if isinstance(item, dict) else item)
+    return False
 
 
 def _redact(value: Any) -> Any:
-    if value is None:
-        return value
+    """Return ``value`` with sensitive strings replaced.
+
+    Containers are walked with an explicit stack rather than recursion, and
+    any nested container in which nothing was replaced is reused as is. A
+    reference back to a container that is still being walked (a cycle) is
+    replaced as well, so the result is finite and acyclic.
+    """
+
     if isinstance(value, str):
-        if _contains_secret(value):
-            return "***REDACTED***"
+        return "***REDACTED***" if _contains_secret(value) else value
+    if not isinstance(value, (dict, list, tuple, set)):
         return value
-    if isinstance(value, dict):
-        return {key: _redact(value[key]) for key in value}
-    if isinstance(value, (list, tuple, set)):
-        container_type = type(value)
-        return container_type(_redact(item) for item in value)
-    return value
+
+    # Each frame holds the container, an iterator over its (key, item) pairs,
+    # the rebuilt pairs so far, the key of the child being descended into and
+    # whether anything below the container was replaced.
+    stack: list[list[Any]] = [[value, _items(value), [], None, False]]
+    # ids of the containers on ``stack``; meeting one again means a cycle.
+    active = {id(value)}
+    while True:
+        frame = stack[-1]
+        for key, item in frame[1]:
+            if isinstance(item, (dict, list, tuple, set)):
+                if id(item) not in active:
+                    frame[3] = key
+                    stack.append([item, _items(item), [], None, False])
+                    active.add(id(item))
+                    break
+                item = "***REDACTED***"
+                frame[4] = True
+            elif isinstance(item, str) and _contains_secret(item):
+                item = "***REDACTED***"
+                frame[4] = True
+            frame[2].append((key, item))
+        else:
+            stack.pop()
+            container, _, pairs, _, changed = frame
+            active.discard(id(container))
+            if not changed:
+                rebuilt: Any = container
+            elif isinstance(container, dict):
+                rebuilt = dict(pairs)
+            else:
+                rebuilt = type(container)(item for _, item in pairs)
+            if not stack:
+                return rebuilt
+            parent = stack[-1]
+            parent[2].append((parent[3], rebuilt))
+            parent[4] = parent[4] or changed
+
+
+def _items(container: Any) -> Iterator[tuple[Any, Any]]:
+    if isinstance(container, dict):
+        return iter(container.items())
+    return ((None, item) for item in container)
 
 
 class _RedactionFilter(logging.Filter):
@@ -62,15 +191,16 @@ class _RedactionFilter(logging.Filter):
         for key in list(record.__dict__.keys()):
             if key in {"args", "msg", "message"}:
                 continue
-            if any(token in key.lower() for token in _SENSITIVE_PATTERNS):
+            if _contains_secret(key):
                 record.__dict__[key] = "***REDACTED***"
-            else:
+            elif _needs_redact(record.__dict__[key]):
                 record.__dict__[key] = _redact(record.__dict__[key])
 
-        if isinstance(record.args, dict):
-            record.args = {key: _redact(value) for key, value in record.args.items()}
-        elif isinstance(record.args, Iterable) and not isinstance(record.args, str):
-            record.args = tuple(_redact(value) for value in record.args)
+        if _needs_redact(record.args):
+            if isinstance(record.args, dict):
+                record.args = {key: _redact(value) for key, value in record.args.items()}
+            elif isinstance(record.args, Iterable) and not isinstance(record.args, str):
+                record.args = tuple(_redact(value) for value in record.args)
 
         if isinstance(record.msg, str) and _contains_secret(record.msg):
             record.msg = "***REDACTED***"
@@ -82,35 +212,14 @@ class _JsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:  # noqa: D401
         payload: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
-            "correlation_id": getattr(record, "correlation_id", _CORRELATION_ID),
+            "correlation_id": getattr(record, "correlation_id", None) or get_correlation_id(),
         }
         for key, value in record.__dict__.items():
-            if key in {
-                "args",
-                "msg",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "message",
-            }:
+            if key in _SKIP_ATTRS:
                 continue
             payload[key] = value
         if record.exc_info:
@@ -192,4 +301,11 @@ def parse_retry_after(value: str) -> float | None:
         return max(delta, 0)
 
 
-__all__ = ["get_logger", "configure_logging", "get_correlation_id", "parse_retry_after"]
+__all__ = [
+    "get_logger",
+    "configure_logging",
+    "get_correlation_id",
+    "set_correlation_id",
+    "reset_correlation_id",
+    "parse_retry_after",
+]
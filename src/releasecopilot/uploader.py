@@ -2,19 +2,71 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from itertools import chain
+from typing import Dict, Iterator, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
 logger = logging.getLogger(__name__)
 
+# Small artifacts are latency bound, so several are uploaded at once; large
+# ones switch to multipart transfers with 16 MiB parts.
+_UPLOAD_WORKERS = 16
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
+# botocore keeps 10 pooled connections per client by default; every worker can
+# have a full multipart transfer in flight, so the default client is sized for
+# that instead of dropping connections once the pool overflows.
+_MAX_POOL_CONNECTIONS = _UPLOAD_WORKERS * _TRANSFER_CONFIG.max_concurrency
+
+_XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+_CONTENT_TYPES: Dict[str, str] = {
+    ".json": "application/json",
+    ".xls": _XLSX_CONTENT_TYPE,
+    ".xlsx": _XLSX_CONTENT_TYPE,
+}
+
+
+def build_s3_client(
+    *,
+    region_name: Optional[str] = None,
+    session: Optional[boto3.session.Session] = None,
+    config: Optional[Config] = None,
+):
+    """Return a boto3 S3 client configured for ``region_name``.
+
+    ``session`` and ``config`` let callers that build several clients share a
+    session and connection-pool settings. Without either, the client for the
+    region is built once and reused.
+    """
 
-def build_s3_client(*, region_name: Optional[str] = None):
-    """Return a boto3 S3 client configured for ``region_name``."""
+    if session is None:
+        if config is None:
+            return _default_s3_client(region_name)
+        return boto3.client("s3", region_name=region_name, config=config)
+    return session.client("s3", region_name=region_name, config=config)
 
-    return boto3.client("s3", region_name=region_name)
+
+@lru_cache(maxsize=4)
+def _default_s3_client(region_name: Optional[str]):
+    # Client construction loads and compiles the service model; boto3 clients
+    # are thread-safe, so one per region serves every put_object call.
+    return boto3.client(
+        "s3",
+        region_name=region_name,
+        config=Config(max_pool_connections=_MAX_POOL_CONNECTIONS),
+    )
 
 
 def put_object(
@@ -63,7 +115,9 @@ def upload_directory(
         Name of the subdirectory to append under ``prefix`` (e.g. ``"reports"``).
     client:
         Optional boto3 S3 client. When omitted, a client is created using
-        :func:`build_s3_client` and ``region_name``.
+        :func:`build_s3_client` and ``region_name``. Files are uploaded
+        concurrently, so a supplied client should allow enough pooled
+        connections (see ``_MAX_POOL_CONNECTIONS``).
     region_name:
         AWS region for the boto3 client when ``client`` is not supplied.
     metadata:
@@ -75,8 +129,9 @@ def upload_directory(
         logger.info("Local directory %s does not exist; skipping upload.", base_path)
         return
 
-    files = [path for path in sorted(base_path.rglob("*")) if path.is_file()]
-    if not files:
+    files = _iter_files(base_path)
+    first_file = next(files, None)
+    if first_file is None:
         logger.info("No files found in %s; nothing to upload.", base_path)
         return
 
@@ -92,11 +147,9 @@ def upload_directory(
         if value is not None
     }
 
-    for file_path in files:
-        relative_key = file_path.relative_to(base_path)
-        key = "/".join(
-            filter(None, [combined_prefix, str(relative_key).replace("\\", "/")])
-        )
+    def _upload(file_path: Path) -> None:
+        relative_key = file_path.relative_to(base_path).as_posix()
+        key = "/".join(filter(None, [combined_prefix, relative_key]))
         extra_args = {"ServerSideEncryption": "AES256"}
         if normalized_metadata:
             extra_args["Metadata"] = normalized_metadata
@@ -105,20 +158,48 @@ def upload_directory(
             extra_args["ContentType"] = content_type
 
         try:
-            client.upload_file(str(file_path), bucket, key, ExtraArgs=extra_args)
-        except (BotoCoreError, ClientError):  # pragma: no cover - network failure path
+            client.upload_file(
+                str(file_path), bucket, key, ExtraArgs=extra_args, Config=_TRANSFER_CONFIG
+            )
+        except (BotoCoreError, ClientError):
             logger.exception("Failed to upload %s to s3://%s/%s", file_path, bucket, key)
             raise
         logger.info("Uploaded %s to s3://%s/%s", file_path, bucket, key)
 
+    with ThreadPoolExecutor(max_workers=_UPLOAD_WORKERS) as executor:
+        futures = [
+            executor.submit(_upload, file_path) for file_path in chain((first_file,), files)
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # Stop queued uploads once one has failed; in-flight ones finish.
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def _iter_files(directory: Path) -> Iterator[Path]:
+    """Yield the files below ``directory`` in no particular order.
+
+    ``os.scandir`` entries carry their file type, so no extra ``stat`` call is
+    needed per path and nothing is collected up front.
+    """
+
+    with os.scandir(directory) as entries:
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            elif entry.is_file():
+                yield Path(entry.path)
+    for subdirectory in subdirectories:
+        yield from _iter_files(Path(subdirectory))
+
 
 def _guess_content_type(path: Path) -> Optional[str]:
-    suffix = path.suffix.lower()
-    if suffix == ".json":
-        return "application/json"
-    if suffix in {".xls", ".xlsx"}:
-        return "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    return None
+    return _CONTENT_TYPES.get(path.suffix.lower())
 
 
 __all__ = ["build_s3_client", "put_object", "upload_directory"]
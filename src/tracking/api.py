@@ -1,20 +1,22 @@
 """Public API for comparing audit run artifacts."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Mapping
 
 from .diff import diff_runs
 
+try:  # pragma: no cover - optional speedup
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    from json import loads as _json_loads
+
 
 def _load_reference(ref: Any) -> Mapping[str, Any]:
     if isinstance(ref, Mapping):
         return ref
     if isinstance(ref, (str, Path)):
-        path = Path(ref)
-        with path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        data = _json_loads(Path(ref).read_bytes())
         if not isinstance(data, Mapping):  # pragma: no cover - defensive
             raise TypeError("Loaded JSON is not a mapping")
         return data
@@ -1,10 +1,14 @@
 """Diff utilities for comparing audit run JSON artifacts."""
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import Dict, List, Mapping, Sequence
 
 
 def _is_sequence(value: object) -> bool:
+    # JSON arrays decode to lists; answer those without the ABC machinery.
+    if type(value) is list:
+        return True
     return isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray))
 
 
@@ -32,11 +36,11 @@ def _story_commit_ids(story: Mapping[str, object]) -> List[str]:
     return values
 
 
-def _orphans(run: Mapping[str, object]) -> List[str]:
+def _orphans(run: Mapping[str, object]) -> set[str]:
     commits = run.get("commits")
     if not _is_sequence(commits):
-        return []
-    orphan_ids: List[str] = []
+        return set()
+    orphan_ids: set[str] = set()
     for commit in commits:  # type: ignore[assignment]
         if not isinstance(commit, Mapping):
             continue
@@ -47,59 +51,22 @@ def _orphans(run: Mapping[str, object]) -> List[str]:
             continue
         commit_id = commit.get("id")
         if isinstance(commit_id, str):
-            orphan_ids.append(commit_id)
-    return sorted(orphan_ids)
+            orphan_ids.add(commit_id)
+    return orphan_ids
+
 
+def _commit_sets(index: Mapping[str, Mapping[str, object]]) -> Dict[str, set[str]]:
+    return {key: set(_story_commit_ids(story)) for key, story in index.items()}
 
-def _coverage_percent(run: Mapping[str, object]) -> float:
-    stories = list(_story_index(run).values())
-    total = len(stories)
+
+def _coverage_percent(commit_sets: Mapping[str, set[str]]) -> float:
+    total = len(commit_sets)
     if total == 0:
         return 0.0
-    with_commits = sum(1 for story in stories if _story_commit_ids(story))
+    with_commits = sum(1 for commit_ids in commit_sets.values() if commit_ids)
     return round((with_commits / total) * 100, 2)
 
 
-def _diff_commit_lists(
-    old: Mapping[str, object], new: Mapping[str, object]
-) -> tuple[List[Dict[str, object]], List[Dict[str, object]]]:
-    added: List[Dict[str, object]] = []
-    removed: List[Dict[str, object]] = []
-
-    old_index = _story_index(old)
-    new_index = _story_index(new)
-    shared_keys = sorted(set(old_index) & set(new_index))
-    new_only_keys = sorted(set(new_index) - set(old_index))
-    removed_keys = sorted(set(old_index) - set(new_index))
-
-    for key in shared_keys:
-        old_commits = set(_story_commit_ids(old_index[key]))
-        new_commits = set(_story_commit_ids(new_index[key]))
-
-        added_ids = sorted(new_commits - old_commits)
-        removed_ids = sorted(old_commits - new_commits)
-
-        if added_ids:
-            added.append({"key": key, "commit_ids": added_ids})
-        if removed_ids:
-            removed.append({"key": key, "commit_ids": removed_ids})
-
-    for key in new_only_keys:
-        commit_ids = sorted(set(_story_commit_ids(new_index[key])))
-        if commit_ids:
-            added.append({"key": key, "commit_ids": commit_ids})
-
-    for key in removed_keys:
-        commit_ids = sorted(set(_story_commit_ids(old_index[key])))
-        if commit_ids:
-            removed.append({"key": key, "commit_ids": commit_ids})
-
-    added.sort(key=lambda item: item.get("key", ""))
-    removed.sort(key=lambda item: item.get("key", ""))
-
-    return added, removed
-
-
 def diff_runs(old: Mapping[str, object], new: Mapping[str, object]) -> Dict[str, object]:
     """Generate a deterministic diff structure between two audit runs."""
 
@@ -112,37 +79,66 @@ def diff_runs(old: Mapping[str, object], new: Mapping[str, object]) -> Dict[str,
     stories_added = sorted(new_keys - old_keys)
     stories_removed = sorted(old_keys - new_keys)
 
+    # Each story's commit ids are collected once and shared by the commit
+    # diff and the coverage figures.
+    old_commits = _commit_sets(old_index)
+    new_commits = _commit_sets(new_index)
+
     status_changes: List[Dict[str, object]] = []
     assignee_changes: List[Dict[str, object]] = []
+    commits_added: List[Dict[str, object]] = []
+    commits_removed: List[Dict[str, object]] = []
 
+    # Status, assignee and commit changes for stories present in both runs are
+    # gathered in a single pass over the shared keys.
     for key in sorted(old_keys & new_keys):
         old_story = old_index[key]
         new_story = new_index[key]
 
-        old_status = old_story.get("status") if isinstance(old_story, Mapping) else None
-        new_status = new_story.get("status") if isinstance(new_story, Mapping) else None
+        old_status = old_story.get("status")
+        new_status = new_story.get("status")
         if old_status != new_status:
             status_changes.append({"key": key, "from": old_status, "to": new_status})
 
-        old_assignee = (
-            old_story.get("assignee") if isinstance(old_story, Mapping) else None
-        )
-        new_assignee = (
-            new_story.get("assignee") if isinstance(new_story, Mapping) else None
-        )
+        old_assignee = old_story.get("assignee")
+        new_assignee = new_story.get("assignee")
         if old_assignee != new_assignee:
             assignee_changes.append({"key": key, "from": old_assignee, "to": new_assignee})
 
-    commits_added, commits_removed = _diff_commit_lists(old, new)
+        old_ids = old_commits[key]
+        new_ids = new_commits[key]
+        # Sort in place, and only when there is something to report.
+        added_ids = list(new_ids - old_ids)
+        if added_ids:
+            added_ids.sort()
+            commits_added.append({"key": key, "commit_ids": added_ids})
+        removed_ids = list(old_ids - new_ids)
+        if removed_ids:
+            removed_ids.sort()
+            commits_removed.append({"key": key, "commit_ids": removed_ids})
+
+    for key in stories_added:
+        if new_commits[key]:
+            commits_added.append({"key": key, "commit_ids": sorted(new_commits[key])})
+
+    for key in stories_removed:
+        if old_commits[key]:
+            commits_removed.append({"key": key, "commit_ids": sorted(old_commits[key])})
+
+    # Shared and added/removed keys were appended as two sorted runs; one
+    # stable sort by key interleaves them.
+    commits_added.sort(key=itemgetter("key"))
+    commits_removed.sort(key=itemgetter("key"))
 
     old_orphans = _orphans(old)
     new_orphans = _orphans(new)
 
-    new_orphan_ids = sorted(set(new_orphans) - set(old_orphans))
-    resolved_orphan_ids = sorted(set(old_orphans) - set(new_orphans))
+    # Orphans are only compared as sets, so they are sorted once, on output.
+    new_orphan_ids = sorted(new_orphans - old_orphans)
+    resolved_orphan_ids = sorted(old_orphans - new_orphans)
 
-    previous_coverage = _coverage_percent(old)
-    current_coverage = _coverage_percent(new)
+    previous_coverage = _coverage_percent(old_commits)
+    current_coverage = _coverage_percent(new_commits)
 
     return {
         "stories_added": stories_added,
@@ -8,10 +8,30 @@ from typing import Any
 
 from .diff import diff_runs, render_diff_markdown
 
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
 
 def _load_json(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    """Write ``payload`` to ``path`` as indented, key-sorted JSON plus a newline.
+
+    Non-ASCII text is written as UTF-8 rather than ``\\uXXXX`` escapes, on both
+    the orjson and the stdlib path, so the bytes do not depend on whether
+    orjson is installed.
+    """
+
+    if orjson is not None:
+        document = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) + b"\n"
+    else:
+        document = (json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n").encode("utf-8")
+    path.write_bytes(document)
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -19,7 +39,7 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--old", required=True, type=Path, help="Path to the previous JSON artifact")
     parser.add_argument("--new", required=True, type=Path, help="Path to the new JSON artifact")
     parser.add_argument("--out", type=Path, help="Optional path to write the markdown summary")
-    parser.add_argument("--json", dest="json_out", type=Path, help="Optional path to write the raw diff JSON")
+    parser.add_argument("--json", dest="json_out", type=Path, help="Optional path to write the raw diff JSON (UTF-8, non-ASCII unescaped)")
     return parser.parse_args(argv)
 
 
@@ -35,7 +55,7 @@ def main(argv: list[str] | None = None) -> int:
     if args.out:
         args.out.write_text(markdown + "\n", encoding="utf-8")
     if args.json_out:
-        args.json_out.write_text(json.dumps(diff, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        _write_json(args.json_out, diff)
 
     print(markdown)
     return 0
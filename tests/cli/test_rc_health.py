@@ -1,19 +1,25 @@
 """Unit tests for the ``rc health`` CLI entry point."""
 from __future__ import annotations
 
-import json
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    import json as orjson  # type: ignore[no-redef]
+
 from src.cli import app
+from src.cli import health as health_cli
 from src.config.loader import load_defaults
 from src.ops.health import ReadinessOptions, ReadinessReport
 
 
-@pytest.fixture(name="defaults")
-def _defaults_fixture(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-    project_root = tmp_path
+@pytest.fixture(scope="session")
+def _defaults_session(tmp_path_factory: pytest.TempPathFactory):
+    project_root = tmp_path_factory.mktemp("rc-root")
     config_dir = project_root / "config"
     config_dir.mkdir()
     settings_path = config_dir / "settings.yaml"
@@ -39,42 +45,53 @@ jira:
         "RC_REPORTS_DIR": str(project_root / "reports"),
         "RC_SETTINGS_FILE": str(settings_path),
     }
+    return load_defaults(env), env
+
+
+@pytest.fixture(name="defaults")
+def _defaults_fixture(_defaults_session, monkeypatch: pytest.MonkeyPatch):
+    # The settings file and ``Defaults`` are built once per session; each
+    # test only re-exports the environment that points at them.
+    defaults, env = _defaults_session
     for key, value in env.items():
         monkeypatch.setenv(key, value)
-    return load_defaults(env)
+    return defaults
+
+
+_REPORT_PASS = ReadinessReport(
+    version="health.v1",
+    timestamp="2024-01-01T00:00:00Z",
+    overall="pass",
+    checks={
+        "secrets": {"status": "pass"},
+        "dynamodb": {"status": "pass"},
+        "s3": {"status": "pass"},
+        "webhook_secret": {"status": "pass"},
+    },
+    cleanup_warning=None,
+    dry_run=False,
+)
+_REPORT_PASS_DRY_RUN = replace(_REPORT_PASS, dry_run=True)
 
 
 def _report(overall: str = "pass", dry_run: bool = False) -> ReadinessReport:
-    return ReadinessReport(
-        version="health.v1",
-        timestamp="2024-01-01T00:00:00Z",
-        overall=overall,
-        checks={
-            "secrets": {"status": "pass"},
-            "dynamodb": {"status": "pass"},
-            "s3": {"status": "pass"},
-            "webhook_secret": {"status": "pass"},
-        },
-        cleanup_warning=None,
-        dry_run=dry_run,
-    )
+    # The CLI only reads the report, so the canned passing ones are shared.
+    if overall == "pass":
+        return _REPORT_PASS_DRY_RUN if dry_run else _REPORT_PASS
+    return replace(_REPORT_PASS, overall=overall, dry_run=dry_run)
 
 
 def test_health_readiness_prints_report(monkeypatch: pytest.MonkeyPatch, defaults, capsys):
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
-    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
-
     def _fake_run(options: ReadinessOptions):
         return _report()
 
-    monkeypatch.setattr("src.cli.health.run_readiness", _fake_run)
+    monkeypatch.setattr(health_cli, "run_readiness", _fake_run)
 
     exit_code = app.main(["health", "--readiness"], defaults=defaults)
     assert exit_code == 0
 
     stdout = capsys.readouterr().out
-    payload = json.loads(stdout)
+    payload = orjson.loads(stdout)
     assert payload["overall"] == "pass"
     assert payload["checks"]["s3"]["status"] == "pass"
 
@@ -82,11 +99,7 @@ def test_health_readiness_prints_report(monkeypatch: pytest.MonkeyPatch, default
 def test_health_readiness_writes_json(monkeypatch: pytest.MonkeyPatch, defaults, tmp_path: Path):
     output_path = tmp_path / "health.json"
 
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
-    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
-
-    monkeypatch.setattr("src.cli.health.run_readiness", lambda options: _report())
+    monkeypatch.setattr(health_cli, "run_readiness", lambda options: _report())
 
     exit_code = app.main(
         ["health", "--readiness", "--json", str(output_path)],
@@ -95,7 +108,7 @@ def test_health_readiness_writes_json(monkeypatch: pytest.MonkeyPatch, defaults,
     assert exit_code == 0
     assert output_path.exists()
 
-    payload = json.loads(output_path.read_text(encoding="utf-8"))
+    payload = orjson.loads(output_path.read_bytes())
     assert payload["overall"] == "pass"
 
 
@@ -106,7 +119,7 @@ def test_health_readiness_respects_overrides(monkeypatch: pytest.MonkeyPatch, de
         captured["options"] = options
         return _report(dry_run=True)
 
-    monkeypatch.setattr("src.cli.health.run_readiness", _capture)
+    monkeypatch.setattr(health_cli, "run_readiness", _capture)
 
     exit_code = app.main(
         [
@@ -134,7 +147,7 @@ def test_health_readiness_respects_overrides(monkeypatch: pytest.MonkeyPatch, de
 
 
 def test_health_requires_readiness_flag(monkeypatch: pytest.MonkeyPatch, defaults, capsys):
-    monkeypatch.setattr("src.cli.health.run_readiness", lambda options: _report())
+    monkeypatch.setattr(health_cli, "run_readiness", lambda options: _report())
 
     exit_code = app.main(["health"], defaults=defaults)
     assert exit_code == 1
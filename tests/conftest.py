@@ -2,46 +2,61 @@
 
 from __future__ import annotations
 
-import json
 import socket
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping
 
 import pytest
 
+from clients.secrets_manager import CredentialStore
 
-@pytest.fixture(autouse=True)
-def _disable_network(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Prevent network access during the test suite.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    import json as orjson  # type: ignore[no-redef]
+
+
+# Shared, read-only payload for the stubbed secret lookups; the loader only
+# reads from it.
+_EMPTY_SECRETS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _no_secrets(self: CredentialStore, arn: str | None) -> Mapping[str, Any]:
+    return _EMPTY_SECRETS
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolate_external_services() -> Iterator[None]:
+    """Prevent network and AWS Secrets Manager access during the test suite.
 
     Several modules rely on optional network calls (e.g. fetching secrets).
-    Tests should never reach out to external services, so we patch the most
-    common socket entry points to raise a helpful error if triggered.
+    Tests should never reach out to external services, so the most common
+    socket entry points raise a helpful error if triggered, and
+    ``CredentialStore.get_all_from_secret`` (used by the config loader) returns
+    an empty mapping. The guards are stateless, so they are installed once for
+    the whole session; tests may still layer their own patches on top.
     """
 
     def _guard(*args: object, **kwargs: object) -> socket.socket:  # type: ignore[override]
         raise RuntimeError("Network access is disabled during tests.")
 
-    monkeypatch.setattr(socket, "socket", _guard)
-    monkeypatch.setattr(socket, "create_connection", _guard)
-
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(socket, "socket", _guard)
+        patcher.setattr(socket, "create_connection", _guard)
+        patcher.setattr(CredentialStore, "get_all_from_secret", _no_secrets)
+        yield
 
-@pytest.fixture(autouse=True)
-def _mock_secrets_manager(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Prevent real AWS Secrets Manager access during tests.
-
-    The config loader uses ``CredentialStore.get_all_from_secret``; stub it to
-    return an empty mapping so tests never reach AWS.
-    """
 
-    def _no_secrets(self, arn):
-        return {}
+@pytest.fixture(scope="session", autouse=True)
+def _fake_aws_credentials() -> Iterator[None]:
+    """Give boto3 dummy static credentials so clients never search for real ones."""
 
-    monkeypatch.setattr(
-        "clients.secrets_manager.CredentialStore.get_all_from_secret",
-        _no_secrets,
-        raising=True,
-    )
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setenv("AWS_ACCESS_KEY_ID", "testing")
+        patcher.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        patcher.setenv("AWS_SESSION_TOKEN", "testing")
+        yield
 
 
 @pytest.fixture
@@ -56,9 +71,7 @@ def load_json() -> "LoadJSONFn":
     """Helper fixture to load JSON fixtures by filename."""
 
     def _loader(path: str | Path) -> Dict[str, Any]:
-        file_path = Path(path)
-        with file_path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return orjson.loads(Path(path).read_bytes())
 
     return _loader
 
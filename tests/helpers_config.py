@@ -69,9 +69,13 @@ secrets:
 """
 
 
+_DEFAULTS_WITH_BUCKET = DEFAULTS_TEMPLATE.format(
+    bucket_block="    bucket: default-bucket\n"
+).encode("utf-8")
+_DEFAULTS_NO_BUCKET = DEFAULTS_TEMPLATE.format(bucket_block="").encode("utf-8")
+
+
 def write_defaults(tmp_path: Path, *, missing_bucket: bool = False) -> Path:
-    bucket_line = "    bucket: default-bucket\n" if not missing_bucket else ""
-    content = DEFAULTS_TEMPLATE.format(bucket_block=bucket_line)
     defaults = tmp_path / "defaults.yml"
-    defaults.write_text(content, encoding="utf-8")
+    defaults.write_bytes(_DEFAULTS_NO_BUCKET if missing_bucket else _DEFAULTS_WITH_BUCKET)
     return defaults
@@ -0,0 +1,17 @@
+"""Checks on the Lambda asset directories packaged by the CDK core stack.
+
+Kept apart from ``test_core_stack`` so it runs without the ``infra`` marker
+and never pulls in aws_cdk.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_lambda_asset_paths_are_stable() -> None:
+    project_root = Path(__file__).resolve().parents[2]
+    webhook_path = project_root / "services" / "jira_sync_webhook"
+    reconciliation_path = project_root / "services" / "jira_reconciliation_job"
+
+    assert webhook_path.is_dir()
+    assert reconciliation_path.is_dir()
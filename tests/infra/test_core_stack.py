@@ -1,13 +1,26 @@
 """Unit tests validating the CDK core stack resources."""
 from __future__ import annotations
 
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from importlib.util import find_spec
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pytest
-from aws_cdk import App, Environment
-from aws_cdk.assertions import Match, Template
 
-from infra.cdk.core_stack import CoreStack
+if TYPE_CHECKING:
+    from aws_cdk.assertions import Template
+
+    from infra.cdk.core_stack import CoreStack
+
+# aws_cdk starts the jsii/Node bridge on import, so it is only imported once a
+# test in this module actually runs; ``-m "not infra"`` skips the cost, and
+# the module is skipped outright when aws_cdk is not installed.
+pytestmark = [
+    pytest.mark.infra,
+    pytest.mark.skipif(find_spec("aws_cdk") is None, reason="aws_cdk is not installed"),
+]
 
 
 ACCOUNT = "123456789012"
@@ -15,20 +28,64 @@ REGION = "us-west-2"
 ASSET_DIR = str(Path(__file__).resolve().parents[2] / "dist")
 
 
-def _synth_template(*, app_context: dict[str, str] | None = None, **overrides) -> Template:
-    app = App(context=app_context or {})
-    stack = CoreStack(
-        app,
-        "TestCoreStack",
-        env=Environment(account=ACCOUNT, region=REGION),
-        bucket_name=f"releasecopilot-artifacts-{ACCOUNT}",
-        lambda_asset_path=ASSET_DIR,
-        **overrides,
+class _CachedTemplate:
+    """Read-only view of a ``Template`` that serialises it only once.
+
+    ``to_json`` and plain ``find_resources`` lookups are answered from the
+    cached template dict, indexed once by resource type; matcher-based
+    assertions go to the wrapped template.
+    """
+
+    def __init__(self, template: Template) -> None:
+        self._template = template
+
+    @cached_property
+    def _json(self) -> dict[str, Any]:
+        return self._template.to_json()
+
+    @cached_property
+    def _resources_by_type(self) -> dict[str, dict[str, Any]]:
+        index: dict[str, dict[str, Any]] = defaultdict(dict)
+        for logical_id, resource in self._json.get("Resources", {}).items():
+            index[resource.get("Type")][logical_id] = resource
+        return index
+
+    def to_json(self) -> dict[str, Any]:
+        return self._json
+
+    def find_resources(self, type_: str, props: Any = None) -> dict[str, Any]:
+        if props is not None:
+            return self._template.find_resources(type_, props)
+        return dict(self._resources_by_type.get(type_, {}))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._template, name)
+
+
+def _synth_template(*, app_context: dict[str, str] | None = None, **overrides) -> _CachedTemplate:
+    # Synthesis dominates this module's runtime and tests only read the
+    # template, so each distinct set of arguments is synthesised once.
+    return _synth_template_cached(
+        tuple(sorted((app_context or {}).items())),
+        tuple(sorted(overrides.items())),
     )
-    return Template.from_stack(stack)
+
+
+@lru_cache(maxsize=None)
+def _synth_template_cached(
+    app_context: tuple[tuple[str, str], ...], overrides: tuple[tuple[str, object], ...]
+) -> _CachedTemplate:
+    from aws_cdk.assertions import Template
+
+    stack = _create_stack(app_context=dict(app_context), **dict(overrides))
+    return _CachedTemplate(Template.from_stack(stack))
 
 
 def _create_stack(*, app_context: dict[str, str] | None = None, **overrides) -> CoreStack:
+    from aws_cdk import App, Environment
+
+    from infra.cdk.core_stack import CoreStack
+
     app = App(context=app_context or {})
     return CoreStack(
         app,
@@ -41,6 +98,8 @@ def _create_stack(*, app_context: dict[str, str] | None = None, **overrides) ->
 
 
 def test_bucket_encryption_and_versioning() -> None:
+    from aws_cdk.assertions import Match
+
     template = _synth_template()
     template.has_resource_properties(
         "AWS::S3::Bucket",
@@ -59,6 +118,12 @@ def test_bucket_encryption_and_versioning() -> None:
                     ]
                 )
             },
+            "PublicAccessBlockConfiguration": {
+                "BlockPublicAcls": True,
+                "BlockPublicPolicy": True,
+                "IgnorePublicAcls": True,
+                "RestrictPublicBuckets": True,
+            },
         },
     )
 
@@ -90,30 +155,31 @@ def test_iam_policy_statements() -> None:
         if "LambdaExecutionPolicy" in name
     )
     statements = policy["Properties"]["PolicyDocument"]["Statement"]
+    statements_by_sid = {stmt["Sid"]: stmt for stmt in statements}
 
-    assert {stmt["Sid"] for stmt in statements} == {
+    assert statements_by_sid.keys() == {
         "AllowS3ObjectAccess",
         "AllowS3ListArtifactsPrefix",
         "AllowSecretRetrieval",
         "AllowLambdaLogging",
     }
 
-    object_statement = next(stmt for stmt in statements if stmt["Sid"] == "AllowS3ObjectAccess")
+    object_statement = statements_by_sid["AllowS3ObjectAccess"]
     assert set(object_statement["Action"]) == {"s3:GetObject", "s3:PutObject"}
     object_resource = object_statement["Resource"]
     assert object_resource["Fn::Join"][1][1] == "/releasecopilot/*"
 
-    list_statement = next(stmt for stmt in statements if stmt["Sid"] == "AllowS3ListArtifactsPrefix")
+    list_statement = statements_by_sid["AllowS3ListArtifactsPrefix"]
     assert list_statement["Action"] == "s3:ListBucket"
     assert list_statement["Condition"] == {
         "StringLike": {"s3:prefix": ["releasecopilot/", "releasecopilot/*"]}
     }
 
-    secrets_statement = next(stmt for stmt in statements if stmt["Sid"] == "AllowSecretRetrieval")
+    secrets_statement = statements_by_sid["AllowSecretRetrieval"]
     assert secrets_statement["Action"] == "secretsmanager:GetSecretValue"
     assert len(secrets_statement["Resource"]) == 2
 
-    logs_statement = next(stmt for stmt in statements if stmt["Sid"] == "AllowLambdaLogging")
+    logs_statement = statements_by_sid["AllowLambdaLogging"]
     assert set(logs_statement["Action"]) == {
         "logs:CreateLogGroup",
         "logs:CreateLogStream",
@@ -123,11 +189,12 @@ def test_iam_policy_statements() -> None:
 
 
 def test_lambda_environment_and_log_groups() -> None:
+    from aws_cdk.assertions import Match
+
     template = _synth_template()
     template.has_resource_properties(
         "AWS::Lambda::Function",
-        Match.object_like(
-            {
+        {
             "Runtime": "python3.11",
             "Environment": {
                 "Variables": Match.object_like(
@@ -138,8 +205,7 @@ def test_lambda_environment_and_log_groups() -> None:
                     }
                 )
             },
-        }
-        ),
+        },
     )
 
     log_groups = template.find_resources("AWS::Logs::LogGroup")
@@ -150,13 +216,83 @@ def test_lambda_environment_and_log_groups() -> None:
     assert not template.find_resources("Custom::LogRetention")
 
 
-def test_lambda_asset_paths_are_stable() -> None:
-    project_root = Path(__file__).resolve().parents[2]
-    webhook_path = project_root / "services" / "jira_sync_webhook"
-    reconciliation_path = project_root / "services" / "jira_reconciliation_job"
+def test_lambda_configuration_overrides() -> None:
+    from aws_cdk.assertions import Match
 
-    assert webhook_path.is_dir()
-    assert reconciliation_path.is_dir()
+    template = _synth_template(
+        lambda_handler="main.handler", lambda_timeout_sec=240, lambda_memory_mb=800
+    )
+
+    template.has_resource_properties(
+        "AWS::Lambda::Function",
+        {
+            "Handler": "main.handler",
+            "Runtime": "python3.11",
+            "Timeout": 240,
+            "MemorySize": 800,
+            "Environment": {
+                "Variables": Match.object_like(
+                    {
+                        "RC_S3_BUCKET": Match.any_value(),
+                        "RC_S3_PREFIX": "releasecopilot",
+                        "RC_USE_AWS_SECRETS_MANAGER": "true",
+                        "JIRA_TABLE_NAME": Match.any_value(),
+                    }
+                )
+            },
+        },
+    )
+
+
+def test_webhook_lambda_table_and_api_created() -> None:
+    from aws_cdk.assertions import Match
+
+    template = _synth_template()
+
+    template.has_resource_properties(
+        "AWS::DynamoDB::Table",
+        {
+            "PointInTimeRecoverySpecification": {"PointInTimeRecoveryEnabled": True},
+            "BillingMode": "PAY_PER_REQUEST",
+            "KeySchema": [
+                {"AttributeName": "issue_id", "KeyType": "HASH"},
+            ],
+            "AttributeDefinitions": Match.array_with(
+                [
+                    Match.object_like({"AttributeName": "issue_id"}),
+                    Match.object_like({"AttributeName": "fix_version"}),
+                    Match.object_like({"AttributeName": "status"}),
+                    Match.object_like({"AttributeName": "assignee"}),
+                ]
+            ),
+            "GlobalSecondaryIndexes": Match.array_with(
+                [
+                    Match.object_like({"IndexName": "FixVersionIndex"}),
+                    Match.object_like({"IndexName": "StatusIndex"}),
+                    Match.object_like({"IndexName": "AssigneeIndex"}),
+                ]
+            ),
+            "SSESpecification": {"SSEEnabled": True},
+        },
+    )
+
+    template.has_resource_properties(
+        "AWS::Lambda::Function",
+        {
+            "Handler": "handler.handler",
+            "Runtime": "python3.11",
+            "Environment": {
+                "Variables": Match.object_like({"TABLE_NAME": Match.any_value()}),
+            },
+        },
+    )
+
+    template.has_resource_properties(
+        "AWS::ApiGateway::RestApi",
+        {"Name": "ReleaseCopilotJiraWebhook"},
+    )
+
+    template.resource_count_is("AWS::SQS::Queue", 1)
 
 
 def test_stack_raises_when_asset_missing(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -237,25 +373,25 @@ def test_eventbridge_rule_absent_when_schedule_disabled() -> None:
 
 
 def test_reconciliation_lambda_and_queue_created() -> None:
+    from aws_cdk.assertions import Match
+
     template = _synth_template()
 
     template.has_resource_properties(
         "AWS::Lambda::Function",
-        Match.object_like(
-            {
-                "Handler": "handler.handler",
-                "Runtime": "python3.11",
-                "Environment": {
-                    "Variables": Match.object_like(
-                        {
-                            "JIRA_BASE_URL": Match.any_value(),
-                            "JIRA_SECRET_ARN": Match.any_value(),
-                            "METRICS_NAMESPACE": "ReleaseCopilot/JiraSync",
-                        }
-                    )
-                },
-            }
-        ),
+        {
+            "Handler": "handler.handler",
+            "Runtime": "python3.11",
+            "Environment": {
+                "Variables": Match.object_like(
+                    {
+                        "JIRA_BASE_URL": Match.any_value(),
+                        "JIRA_SECRET_ARN": Match.any_value(),
+                        "METRICS_NAMESPACE": "ReleaseCopilot/JiraSync",
+                    }
+                )
+            },
+        },
     )
 
     template.has_resource_properties(
@@ -3,31 +3,91 @@ from __future__ import annotations
 
 import json
 from contextlib import ExitStack
+from typing import Iterator, Tuple
 
 import boto3
 import pytest
 from botocore.stub import ANY, Stubber
 
+from src.ops import health
 from src.ops.health import ReadinessClients, ReadinessOptions, run_readiness
 
 
+@pytest.fixture(scope="module")
+def clients() -> ReadinessClients:
+    # Building clients loads botocore service models; each test activates its
+    # own Stubbers on these shared instances.
+    return ReadinessClients(
+        secrets=boto3.client("secretsmanager", region_name="us-east-1"),
+        dynamodb=boto3.client("dynamodb", region_name="us-east-1"),
+        s3=boto3.client("s3", region_name="us-east-1"),
+    )
+
+
 @pytest.fixture(autouse=True)
-def _aws_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
-    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+def _reset_table_caches() -> None:
+    # DescribeTable and DescribeTimeToLive results are memoised per client and
+    # table; clear them so every test scripts its own responses.
+    health._table_schema.cache_clear()
+    health._ttl_attribute.cache_clear()
 
 
-def _clients(region: str = "us-east-1") -> ReadinessClients:
-    return ReadinessClients(
-        secrets=boto3.client("secretsmanager", region_name=region),
-        dynamodb=boto3.client("dynamodb", region_name=region),
-        s3=boto3.client("s3", region_name=region),
+@pytest.fixture
+def stubs(clients: ReadinessClients) -> Iterator[Tuple[Stubber, Stubber, Stubber]]:
+    """Activate Stubbers for the secrets, DynamoDB and S3 clients."""
+
+    with ExitStack() as stack:
+        yield (
+            stack.enter_context(Stubber(clients.secrets)),
+            stack.enter_context(Stubber(clients.dynamodb)),
+            stack.enter_context(Stubber(clients.s3)),
+        )
+
+
+def _add_ddb_probe(stub: Stubber, table: str, key: str = "pk") -> None:
+    """Script a healthy DynamoDB readiness probe against ``table``."""
+
+    stub.add_response(
+        "describe_table",
+        {
+            "Table": {
+                "TableName": table,
+                "KeySchema": [{"AttributeName": key, "KeyType": "HASH"}],
+                "AttributeDefinitions": [{"AttributeName": key, "AttributeType": "S"}],
+            }
+        },
+        {"TableName": table},
     )
+    stub.add_response(
+        "describe_time_to_live",
+        {"TimeToLiveDescription": {"TimeToLiveStatus": "DISABLED"}},
+        {"TableName": table},
+    )
+    stub.add_response("put_item", {}, {"TableName": table, "Item": {key: {"S": ANY}}})
+    stub.add_response("delete_item", {}, {"TableName": table, "Key": {key: {"S": ANY}}})
+
+
+def _add_s3_put(stub: Stubber, bucket: str) -> None:
+    stub.add_response(
+        "put_object",
+        {},
+        {
+            "Bucket": bucket,
+            "Key": ANY,
+            "Body": b"releasecopilot-readiness",
+            "ServerSideEncryption": "AES256",
+        },
+    )
+
+
+def _add_s3_probe(stub: Stubber, bucket: str) -> None:
+    """Script a healthy S3 readiness probe (upload then cleanup) in ``bucket``."""
+
+    _add_s3_put(stub, bucket)
+    stub.add_response("delete_object", {}, {"Bucket": bucket, "Key": ANY})
 
 
-def test_run_readiness_success() -> None:
-    clients = _clients()
+def test_run_readiness_success(clients: ReadinessClients, stubs: Tuple[Stubber, Stubber, Stubber]) -> None:
     options = ReadinessOptions(
         region="us-east-1",
         bucket="releasecopilot-artifacts",
@@ -39,61 +99,22 @@ def test_run_readiness_success() -> None:
         clients=clients,
     )
 
-    with ExitStack() as stack:
-        secrets_stub = stack.enter_context(Stubber(clients.secrets))
-        ddb_stub = stack.enter_context(Stubber(clients.dynamodb))
-        s3_stub = stack.enter_context(Stubber(clients.s3))
-
-        secrets_stub.add_response(
-            "get_secret_value",
-            {"SecretString": json.dumps({"token": "value"})},
-            {"SecretId": "secret/jira"},
-        )
-        secrets_stub.add_response(
-            "get_secret_value",
-            {"SecretString": "webhook"},
-            {"SecretId": "secret/webhook"},
-        )
+    secrets_stub, ddb_stub, s3_stub = stubs
+    secrets_stub.add_response(
+        "get_secret_value",
+        {"SecretString": json.dumps({"token": "value"})},
+        {"SecretId": "secret/jira"},
+    )
+    secrets_stub.add_response(
+        "get_secret_value",
+        {"SecretString": "webhook"},
+        {"SecretId": "secret/webhook"},
+    )
 
-        ddb_stub.add_response(
-            "describe_table",
-            {
-                "Table": {
-                    "TableName": options.table_name,
-                    "KeySchema": [{"AttributeName": "issue_id", "KeyType": "HASH"}],
-                    "AttributeDefinitions": [{"AttributeName": "issue_id", "AttributeType": "S"}],
-                }
-            },
-            {"TableName": options.table_name},
-        )
-        ddb_stub.add_response(
-            "put_item",
-            {},
-            {"TableName": options.table_name, "Item": {"issue_id": {"S": ANY}}},
-        )
-        ddb_stub.add_response(
-            "delete_item",
-            {},
-            {"TableName": options.table_name, "Key": {"issue_id": {"S": ANY}}},
-        )
+    _add_ddb_probe(ddb_stub, options.table_name, key="issue_id")
+    _add_s3_probe(s3_stub, options.bucket)
 
-        s3_stub.add_response(
-            "put_object",
-            {},
-            {
-                "Bucket": options.bucket,
-                "Key": ANY,
-                "Body": b"releasecopilot-readiness",
-                "ServerSideEncryption": "AES256",
-            },
-        )
-        s3_stub.add_response(
-            "delete_object",
-            {},
-            {"Bucket": options.bucket, "Key": ANY},
-        )
-
-        report = run_readiness(options)
+    report = run_readiness(options)
 
     assert report.is_success()
     assert report.cleanup_warning is None
@@ -103,8 +124,7 @@ def test_run_readiness_success() -> None:
     assert report.checks["webhook_secret"]["status"] == "pass"
 
 
-def test_readiness_reports_secret_failure() -> None:
-    clients = _clients()
+def test_readiness_reports_secret_failure(clients: ReadinessClients, stubs: Tuple[Stubber, Stubber, Stubber]) -> None:
     options = ReadinessOptions(
         region="us-east-1",
         bucket="bucket",
@@ -116,64 +136,24 @@ def test_readiness_reports_secret_failure() -> None:
         clients=clients,
     )
 
-    with ExitStack() as stack:
-        secrets_stub = stack.enter_context(Stubber(clients.secrets))
-        ddb_stub = stack.enter_context(Stubber(clients.dynamodb))
-        s3_stub = stack.enter_context(Stubber(clients.s3))
-
-        secrets_stub.add_client_error(
-            "get_secret_value",
-            service_error_code="ResourceNotFoundException",
-            expected_params={"SecretId": "secret/missing"},
-        )
-
-        ddb_stub.add_response(
-            "describe_table",
-            {
-                "Table": {
-                    "TableName": options.table_name,
-                    "KeySchema": [{"AttributeName": "pk", "KeyType": "HASH"}],
-                    "AttributeDefinitions": [{"AttributeName": "pk", "AttributeType": "S"}],
-                }
-            },
-            {"TableName": options.table_name},
-        )
-        ddb_stub.add_response(
-            "put_item",
-            {},
-            {"TableName": options.table_name, "Item": {"pk": {"S": ANY}}},
-        )
-        ddb_stub.add_response(
-            "delete_item",
-            {},
-            {"TableName": options.table_name, "Key": {"pk": {"S": ANY}}},
-        )
+    secrets_stub, ddb_stub, s3_stub = stubs
+    secrets_stub.add_client_error(
+        "get_secret_value",
+        service_error_code="ResourceNotFoundException",
+        expected_params={"SecretId": "secret/missing"},
+    )
 
-        s3_stub.add_response(
-            "put_object",
-            {},
-            {
-                "Bucket": options.bucket,
-                "Key": ANY,
-                "Body": b"releasecopilot-readiness",
-                "ServerSideEncryption": "AES256",
-            },
-        )
-        s3_stub.add_response(
-            "delete_object",
-            {},
-            {"Bucket": options.bucket, "Key": ANY},
-        )
+    _add_ddb_probe(ddb_stub, options.table_name)
+    _add_s3_probe(s3_stub, options.bucket)
 
-        report = run_readiness(options)
+    report = run_readiness(options)
 
     assert not report.is_success()
     assert report.checks["secrets"]["status"] == "fail"
     assert "unable to read" in report.checks["secrets"].get("reason", "")
 
 
-def test_webhook_missing_fails() -> None:
-    clients = _clients()
+def test_webhook_missing_fails(clients: ReadinessClients, stubs: Tuple[Stubber, Stubber, Stubber]) -> None:
     options = ReadinessOptions(
         region="us-east-1",
         bucket="bucket",
@@ -185,10 +165,64 @@ def test_webhook_missing_fails() -> None:
         clients=clients,
     )
 
-    with ExitStack() as stack:
-        ddb_stub = stack.enter_context(Stubber(clients.dynamodb))
-        s3_stub = stack.enter_context(Stubber(clients.s3))
+    _, ddb_stub, s3_stub = stubs
+    _add_ddb_probe(ddb_stub, options.table_name)
+    _add_s3_probe(s3_stub, options.bucket)
+
+    report = run_readiness(options)
+
+    assert not report.is_success()
+    assert report.checks["webhook_secret"]["status"] == "fail"
+    assert "not configured" in report.checks["webhook_secret"].get("reason", "")
+
+
+def test_s3_cleanup_warning(clients: ReadinessClients, stubs: Tuple[Stubber, Stubber, Stubber]) -> None:
+    options = ReadinessOptions(
+        region="us-east-1",
+        bucket="bucket",
+        prefix=None,
+        table_name="table",
+        secrets={},
+        webhook_secret_id="secret/webhook",
+        webhook_env_present=True,
+        clients=clients,
+    )
+
+    secrets_stub, ddb_stub, s3_stub = stubs
+    secrets_stub.add_response(
+        "get_secret_value",
+        {"SecretString": "token"},
+        {"SecretId": "secret/webhook"},
+    )
+
+    _add_ddb_probe(ddb_stub, options.table_name)
+    _add_s3_put(s3_stub, options.bucket)
+    s3_stub.add_client_error(
+        "delete_object",
+        service_error_code="AccessDenied",
+        expected_params={"Bucket": options.bucket, "Key": ANY},
+    )
+
+    report = run_readiness(options)
 
+    assert report.is_success()
+    assert report.cleanup_warning is not None
+    assert "S3" in report.cleanup_warning
+
+
+def test_dynamodb_sentinel_expires_via_ttl(clients: ReadinessClients) -> None:
+    options = ReadinessOptions(
+        region="us-east-1",
+        bucket=None,
+        prefix=None,
+        table_name="ttl-table",
+        secrets={},
+        webhook_secret_id=None,
+        webhook_env_present=True,
+        clients=clients,
+    )
+
+    with Stubber(clients.dynamodb) as ddb_stub:
         ddb_stub.add_response(
             "describe_table",
             {
@@ -201,63 +235,39 @@ def test_webhook_missing_fails() -> None:
             {"TableName": options.table_name},
         )
         ddb_stub.add_response(
-            "put_item",
-            {},
-            {"TableName": options.table_name, "Item": {"pk": {"S": ANY}}},
+            "describe_time_to_live",
+            {"TimeToLiveDescription": {"TimeToLiveStatus": "ENABLED", "AttributeName": "expires_at"}},
+            {"TableName": options.table_name},
         )
         ddb_stub.add_response(
-            "delete_item",
-            {},
-            {"TableName": options.table_name, "Key": {"pk": {"S": ANY}}},
-        )
-
-        s3_stub.add_response(
-            "put_object",
+            "put_item",
             {},
             {
-                "Bucket": options.bucket,
-                "Key": ANY,
-                "Body": b"releasecopilot-readiness",
-                "ServerSideEncryption": "AES256",
+                "TableName": options.table_name,
+                "Item": {"pk": {"S": ANY}, "expires_at": {"N": ANY}},
             },
         )
-        s3_stub.add_response(
-            "delete_object",
-            {},
-            {"Bucket": options.bucket, "Key": ANY},
-        )
 
         report = run_readiness(options)
+        ddb_stub.assert_no_pending_responses()
 
-    assert not report.is_success()
-    assert report.checks["webhook_secret"]["status"] == "fail"
-    assert "not configured" in report.checks["webhook_secret"].get("reason", "")
+    assert report.checks["dynamodb"]["status"] == "pass"
+    assert report.cleanup_warning is None
 
 
-def test_s3_cleanup_warning() -> None:
-    clients = _clients()
+def test_dynamodb_schema_is_described_once_per_table(clients: ReadinessClients) -> None:
     options = ReadinessOptions(
         region="us-east-1",
-        bucket="bucket",
+        bucket=None,
         prefix=None,
-        table_name="table",
+        table_name="cached-table",
         secrets={},
-        webhook_secret_id="secret/webhook",
+        webhook_secret_id=None,
         webhook_env_present=True,
         clients=clients,
     )
 
-    with ExitStack() as stack:
-        secrets_stub = stack.enter_context(Stubber(clients.secrets))
-        ddb_stub = stack.enter_context(Stubber(clients.dynamodb))
-        s3_stub = stack.enter_context(Stubber(clients.s3))
-
-        secrets_stub.add_response(
-            "get_secret_value",
-            {"SecretString": "token"},
-            {"SecretId": "secret/webhook"},
-        )
-
+    with Stubber(clients.dynamodb) as ddb_stub:
         ddb_stub.add_response(
             "describe_table",
             {
@@ -270,41 +280,65 @@ def test_s3_cleanup_warning() -> None:
             {"TableName": options.table_name},
         )
         ddb_stub.add_response(
-            "put_item",
-            {},
-            {"TableName": options.table_name, "Item": {"pk": {"S": ANY}}},
-        )
-        ddb_stub.add_response(
-            "delete_item",
-            {},
-            {"TableName": options.table_name, "Key": {"pk": {"S": ANY}}},
+            "describe_time_to_live",
+            {"TimeToLiveDescription": {"TimeToLiveStatus": "DISABLED"}},
+            {"TableName": options.table_name},
         )
+        for _ in range(2):
+            ddb_stub.add_response(
+                "put_item", {}, {"TableName": options.table_name, "Item": {"pk": {"S": ANY}}}
+            )
+            ddb_stub.add_response(
+                "delete_item", {}, {"TableName": options.table_name, "Key": {"pk": {"S": ANY}}}
+            )
+            report = run_readiness(options)
+            assert report.checks["dynamodb"]["status"] == "pass"
 
-        s3_stub.add_response(
-            "put_object",
-            {},
+        ddb_stub.assert_no_pending_responses()
+
+
+def test_multiple_secrets_use_batch_read(clients: ReadinessClients, caplog: pytest.LogCaptureFixture) -> None:
+    options = ReadinessOptions(
+        region="us-east-1",
+        bucket=None,
+        prefix=None,
+        table_name=None,
+        secrets={"jira": "secret/jira", "webhook": "secret/webhook", "bitbucket": "secret/bb"},
+        webhook_secret_id="secret/webhook",
+        webhook_env_present=False,
+        clients=clients,
+    )
+
+    with Stubber(clients.secrets) as secrets_stub:
+        secrets_stub.add_response(
+            "batch_get_secret_value",
             {
-                "Bucket": options.bucket,
-                "Key": ANY,
-                "Body": b"releasecopilot-readiness",
-                "ServerSideEncryption": "AES256",
+                "SecretValues": [
+                    {"Name": "secret/jira", "SecretString": "token"},
+                    {"Name": "secret/webhook", "SecretString": "hook"},
+                ],
+                "Errors": [
+                    {
+                        "SecretId": "secret/bb",
+                        "ErrorCode": "ResourceNotFoundException",
+                        "Message": "Resource not found.",
+                    }
+                ],
             },
+            {"SecretIdList": ["secret/jira", "secret/webhook", "secret/bb"]},
         )
-        s3_stub.add_client_error(
-            "delete_object",
-            service_error_code="AccessDenied",
-            expected_params={"Bucket": options.bucket, "Key": ANY},
-        )
-
         report = run_readiness(options)
+        secrets_stub.assert_no_pending_responses()
 
-    assert report.is_success()
-    assert report.cleanup_warning is not None
-    assert "S3" in report.cleanup_warning
+    assert report.checks["secrets"]["status"] == "fail"
+    assert "bitbucket: unable to read secret (ResourceNotFoundException)" in report.checks["secrets"]["reason"]
+    # Only the bitbucket read fails; the batch path logs the provider message
+    # as ``error``, the same field the single-read path fills from the exception.
+    assert [record.error for record in caplog.records if hasattr(record, "error")] == ["Resource not found."]
+    assert report.checks["webhook_secret"]["status"] == "pass"
 
 
-def test_dry_run_skips_aws_calls() -> None:
-    clients = _clients()
+def test_dry_run_skips_aws_calls(clients: ReadinessClients) -> None:
     options = ReadinessOptions(
         region="us-east-1",
         bucket="bucket",
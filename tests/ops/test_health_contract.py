@@ -5,27 +5,29 @@ import json
 from pathlib import Path
 
 import jsonschema
+import pytest
 
 from src.ops.health import ReadinessClients, ReadinessOptions, run_readiness
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
-def _schema() -> dict:
+@pytest.fixture(scope="module")
+def validator() -> jsonschema.protocols.Validator:
     schema_path = REPO_ROOT / "docs" / "schemas" / "health.v1.json"
-    return json.loads(schema_path.read_text(encoding="utf-8"))
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
 
 
-def test_example_payload_matches_schema() -> None:
+def test_example_payload_matches_schema(validator: jsonschema.protocols.Validator) -> None:
     example_path = REPO_ROOT / "docs" / "examples" / "health" / "health-pass.v1.json"
     example = json.loads(example_path.read_text(encoding="utf-8"))
-    jsonschema.validate(instance=example, schema=_schema())
+    validator.validate(example)
 
 
-def test_dry_run_report_matches_schema(monkeypatch) -> None:
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
-    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+def test_dry_run_report_matches_schema(validator: jsonschema.protocols.Validator) -> None:
     options = ReadinessOptions(
         region="us-east-1",
         bucket="bucket",
@@ -39,4 +41,4 @@ def test_dry_run_report_matches_schema(monkeypatch) -> None:
     )
 
     report = run_readiness(options)
-    jsonschema.validate(instance=report.as_dict(), schema=_schema())
+    validator.validate(report.as_dict())
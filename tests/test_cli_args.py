@@ -4,6 +4,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from releasecopilot import cli
+from releasecopilot.config import load_env_overrides, load_yaml_defaults
 
 
 def test_parse_args_supports_boolean_flags() -> None:
@@ -48,3 +49,50 @@ def test_run_builds_config_from_yaml(tmp_path: Path) -> None:
     assert result["jira_base"] == "https://jira.cli"
     assert result["bitbucket_base"] == "https://bitbucket.cli"
     assert result["config_path"] == str(config_file)
+
+
+def test_run_normalises_config_key_case(tmp_path: Path) -> None:
+    config_file = tmp_path / "releasecopilot.yaml"
+    config_file.write_text(
+        """
+        Fix_Version: 9.9.9
+        jira_base: https://jira.cli
+        bitbucket_base: https://bitbucket.cli
+        secrets:
+          JIRA_TOKEN: from-yaml
+        """
+    )
+
+    result = cli.run(["--config", str(config_file)])
+
+    assert result["fix_version"] == "9.9.9"
+    assert result["jira_token"] == "from-yaml"
+
+
+def test_env_overrides_prefer_unprefixed_names(monkeypatch) -> None:
+    monkeypatch.setenv("RELEASECOPILOT_JIRA_USER", "prefixed")
+    monkeypatch.setenv("JIRA_USER", "plain")
+    monkeypatch.setenv("RELEASE_COPILOT_USE_AWS_SECRETS_MANAGER", "yes")
+    monkeypatch.setenv("RELEASECOPILOT_CUSTOM_LABEL", "from-yaml-key")
+
+    overrides = load_env_overrides(
+        ["jira_user", "use_aws_secrets_manager", "s3_prefix", "custom_label"]
+    )
+
+    assert overrides["jira_user"] == "plain"
+    assert overrides["custom_label"] == "from-yaml-key"
+    assert overrides["use_aws_secrets_manager"] is True
+    assert "s3_prefix" not in overrides
+
+
+def test_load_yaml_defaults_returns_fresh_copies(tmp_path: Path) -> None:
+    config_file = tmp_path / "releasecopilot.yaml"
+    config_file.write_text("fix_version: 1.0.0\nsecrets:\n  jira_token: a\n", encoding="utf-8")
+
+    first = load_yaml_defaults(config_file)
+    first["secrets"]["jira_token"] = "mutated"
+
+    assert load_yaml_defaults(config_file)["secrets"]["jira_token"] == "a"
+
+    config_file.write_text("fix_version: 2.0.0\n", encoding="utf-8")
+    assert load_yaml_defaults(config_file) == {"fix_version": "2.0.0"}
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from src.config.loader import load_config
+from src.config.loader import _deep_merge_many, load_config
 
 from tests.helpers_config import StubCredentialStore, write_defaults
 
@@ -41,3 +41,19 @@ def test_list_overrides_replace_values(tmp_path: Path) -> None:
     )
 
     assert config["bitbucket"]["repositories"] == ["repo-1", "repo-2"]
+
+
+def test_deep_merge_many_matches_sequential_precedence() -> None:
+    merged = _deep_merge_many(
+        [
+            {"jira": {"scopes": {"project": "A", "jql": "x"}, "base_url": "one"}, "keep": 1},
+            {"jira": {"scopes": {"project": "B"}}, "keep": {"nested": True}},
+            {"jira": "replaced-by-scalar", "keep": {"other": False}},
+            {"jira": {"base_url": "three"}},
+        ]
+    )
+
+    assert merged == {
+        "jira": {"base_url": "three"},
+        "keep": {"nested": True, "other": False},
+    }
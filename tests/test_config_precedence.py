@@ -54,3 +54,26 @@ def test_environment_overrides_secret_values(tmp_path: Path) -> None:
     )
 
     assert config["jira"]["credentials"]["client_secret"] == "env-value"
+
+
+def test_secrets_shadowed_by_environment_are_not_fetched(tmp_path: Path) -> None:
+    defaults = write_defaults(tmp_path)
+    requested: list[str] = []
+
+    class _RecordingStore(StubCredentialStore):
+        def get_all_from_secret(self, secret_id):
+            requested.append(secret_id)
+            return super().get_all_from_secret(secret_id)
+
+    env = {"WEBHOOK_SECRET": "env-webhook", "JIRA_CLIENT_ID": "env-client"}
+    config = load_config(
+        defaults_path=defaults,
+        env=env,
+        credential_store=_RecordingStore(),
+        override_path=tmp_path / "settings.yaml",
+        overrides={"bitbucket": {"credentials": {"username": "cli-user"}}},
+    )
+
+    assert requested == []
+    assert config["webhooks"]["jira"]["secret"] == "env-webhook"
+    assert config["bitbucket"]["credentials"]["username"] == "cli-user"
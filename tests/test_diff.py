@@ -1,6 +1,11 @@
 """Unit tests for deterministic diffing of audit runs."""
 from __future__ import annotations
 
+import json
+
+import pytest
+
+from tracking import diff_cli
 from tracking.diff import diff_runs
 
 
@@ -74,3 +79,32 @@ def test_diff_runs_returns_sorted_changes() -> None:
     assert diff["coverage_previous"] == 100.0
     assert diff["coverage_current"] == 100.0
     assert diff["coverage_delta"] == 0.0
+
+
+def test_diff_cli_writes_sorted_json(tmp_path, capsys) -> None:
+    old_path = tmp_path / "old.json"
+    new_path = tmp_path / "new.json"
+    out_path = tmp_path / "diff.json"
+    old_path.write_text(json.dumps({"stories": [{"key": "S-1", "status": "To Do"}]}), encoding="utf-8")
+    new_path.write_text(json.dumps({"stories": [{"key": "S-1", "status": "Done"}]}), encoding="utf-8")
+
+    assert diff_cli.main(["--old", str(old_path), "--new", str(new_path), "--json", str(out_path)]) == 0
+    capsys.readouterr()
+
+    written = out_path.read_text(encoding="utf-8")
+    diff = json.loads(written)
+    assert written == json.dumps(diff, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+    assert diff == diff_runs(json.loads(old_path.read_text()), json.loads(new_path.read_text()))
+
+
+def test_diff_cli_json_bytes_do_not_depend_on_orjson(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = {"stories": [{"key": "S-1", "assignee": "Zoë"}], "coverage_delta": 0.5}
+    fast_path = tmp_path / "fast.json"
+    fallback_path = tmp_path / "fallback.json"
+
+    diff_cli._write_json(fast_path, payload)
+    monkeypatch.setattr(diff_cli, "orjson", None)
+    diff_cli._write_json(fallback_path, payload)
+
+    assert fast_path.read_bytes() == fallback_path.read_bytes()
+    assert "Zoë".encode("utf-8") in fallback_path.read_bytes()
@@ -2,25 +2,32 @@ from __future__ import annotations
 
 import importlib
 import json
+import logging
 import sys
 from types import ModuleType
 
 import pytest
 
 
-def _reload_logging(monkeypatch: pytest.MonkeyPatch, **env: str) -> ModuleType:
+def _fresh_logging(monkeypatch: pytest.MonkeyPatch, **env: str) -> ModuleType:
+    """Return ``releasecopilot.logging_config`` reset to its unconfigured state.
+
+    Resetting the module globals is equivalent to a fresh import for these
+    tests without re-executing the module (and its package) every time.
+    """
+
     for key, value in env.items():
         monkeypatch.setenv(key, value)
-    for name in list(sys.modules):
-        if name.startswith("releasecopilot"):
-            sys.modules.pop(name)
-    return importlib.import_module("releasecopilot.logging_config")
+    module = importlib.import_module("releasecopilot.logging_config")
+    monkeypatch.setattr(module, "_CONFIGURED", False)
+    module._default_correlation_id.cache_clear()
+    return module
 
 
 def test_structured_logging_includes_correlation_id(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
     monkeypatch.setenv("RC_CORR_ID", "test-corr-id")
     monkeypatch.delenv("RC_LOG_JSON", raising=False)
-    logging_module = _reload_logging(monkeypatch)
+    logging_module = _fresh_logging(monkeypatch)
     logging_module.configure_logging("INFO")
     logger = logging_module.get_logger("test.logger")
 
@@ -33,20 +40,22 @@ def test_structured_logging_includes_correlation_id(monkeypatch: pytest.MonkeyPa
 
 
 def test_json_logging_mode(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
-    logging_module = _reload_logging(monkeypatch, RC_LOG_JSON="true")
+    logging_module = _fresh_logging(monkeypatch, RC_LOG_JSON="true")
     logging_module.configure_logging("INFO")
     logger = logging_module.get_logger("json.logger")
 
     logger.info("structured message")
 
-    payload = json.loads(capsys.readouterr().out.strip())
+    line = capsys.readouterr().out.strip()
+    payload = json.loads(line)
     assert payload["message"] == "structured message"
+    assert '"message": "structured message"' in line
     assert payload["correlation_id"] == logging_module.get_correlation_id()
 
 
 def test_secret_redaction(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
     monkeypatch.delenv("RC_LOG_JSON", raising=False)
-    logging_module = _reload_logging(monkeypatch)
+    logging_module = _fresh_logging(monkeypatch)
     logging_module.configure_logging("DEBUG")
     logger = logging_module.get_logger("redact.logger")
 
@@ -56,3 +65,83 @@ def test_secret_redaction(monkeypatch: pytest.MonkeyPatch, capsys: pytest.Captur
     assert "***REDACTED***" in output
     assert "abc123" not in output
     assert "shhh" not in output
+
+
+def test_child_logger_level_overrides_root_level(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.delenv("RC_LOG_JSON", raising=False)
+    logging_module = _fresh_logging(monkeypatch)
+    logging_module.configure_logging("INFO")
+    logger = logging_module.get_logger("verbose.logger")
+    logger.setLevel(logging.DEBUG)
+
+    logger.debug("chatty", extra={"api_token": "abc123"})
+
+    output = capsys.readouterr().out
+    assert "chatty" in output
+    assert "abc123" not in output
+
+
+def test_clean_context_is_not_copied(monkeypatch: pytest.MonkeyPatch) -> None:
+    logging_module = _fresh_logging(monkeypatch)
+    context = {"issues": ["ABC-1", "ABC-2"], "counts": (1, 2)}
+    record = logging.LogRecord("ctx", logging.INFO, __file__, 1, "msg %s", ("clean",), None)
+    record.context = context
+    record.nested = {"inner": ["bearer-token-value"]}
+
+    logging_module._RedactionFilter().filter(record)
+
+    assert record.context is context
+    assert record.args == ("clean",)
+    assert record.nested == {"inner": ["***REDACTED***"]}
+
+
+def test_cyclic_clean_context_is_passed_through(monkeypatch: pytest.MonkeyPatch) -> None:
+    logging_module = _fresh_logging(monkeypatch)
+    context: dict[str, object] = {"issues": ["ABC-1"]}
+    context["self"] = context
+    record = logging.LogRecord("ctx", logging.INFO, __file__, 1, "msg", (), None)
+    record.context = context
+
+    assert logging_module._RedactionFilter().filter(record)
+    assert record.context is context
+
+
+def test_correlation_id_can_be_scoped_to_context(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.setenv("RC_CORR_ID", "run-corr-id")
+    logging_module = _fresh_logging(monkeypatch, RC_LOG_JSON="true")
+    logging_module.configure_logging("INFO")
+    logger = logging_module.get_logger("scoped.logger")
+
+    token = logging_module.set_correlation_id("request-corr-id")
+    try:
+        logger.info("inside request")
+    finally:
+        logging_module.reset_correlation_id(token)
+    logger.info("after request")
+
+    first, second = (json.loads(line) for line in capsys.readouterr().out.strip().splitlines())
+    assert first["correlation_id"] == "request-corr-id"
+    assert second["correlation_id"] == "run-corr-id"
+
+
+def test_redaction_handles_deeply_nested_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    logging_module = _fresh_logging(monkeypatch)
+    nested: object = ["api token"]
+    for _ in range(sys.getrecursionlimit() * 2):
+        nested = [nested]
+
+    redacted = logging_module._redact({"clean": ["a", "b"], "nested": nested})
+
+    innermost = redacted["nested"]
+    while isinstance(innermost, list) and isinstance(innermost[0], list):
+        innermost = innermost[0]
+    assert innermost == ["***REDACTED***"]
+
+    cyclic: dict[str, object] = {"token": "api token", "items": []}
+    cyclic["self"] = cyclic
+    cyclic["items"].append(cyclic)  # type: ignore[attr-defined]
+
+    redacted_cyclic = logging_module._redact(cyclic)
+
+    assert redacted_cyclic == {"token": "***REDACTED***", "items": ["***REDACTED***"], "self": "***REDACTED***"}
+    assert cyclic["self"] is cyclic
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from botocore.exceptions import ClientError
 
 from releasecopilot import aws_secrets
 from releasecopilot.config import resolve_secret
@@ -33,3 +36,76 @@ def test_resolve_secret_uses_aws(monkeypatch: pytest.MonkeyPatch):
     assert resolve_secret("jira_token", cfg) == "from-aws"
     assert resolve_secret("jira_token", cfg) == "from-aws"
     assert calls == ["jira_token"]
+
+
+def test_get_secret_retries_failed_lookups_after_ttl(monkeypatch: pytest.MonkeyPatch):
+    responses: list[object] = [
+        ClientError({"Error": {"Code": "ThrottlingException"}}, "GetSecretValue"),
+        {"SecretString": "recovered"},
+    ]
+
+    class FakeClient:
+        def get_secret_value(self, SecretId: str):  # noqa: N803 - boto3 signature
+            outcome = responses.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+    clock = [1000.0]
+    monkeypatch.setattr(aws_secrets, "_client", lambda: FakeClient())
+    monkeypatch.setattr(aws_secrets, "_monotonic", lambda: clock[0])
+    monkeypatch.setattr(aws_secrets, "_MISSING_UNTIL", {})
+    aws_secrets._fetch_secret.cache_clear()
+
+    assert aws_secrets.get_secret("flaky") is None
+    assert aws_secrets.get_secret("flaky") is None  # still inside the negative TTL
+    clock[0] += aws_secrets._NEGATIVE_TTL_SECONDS
+    assert aws_secrets.get_secret("flaky") == "recovered"
+    assert aws_secrets.get_secret("flaky") == "recovered"  # served from cache
+    assert responses == []
+    aws_secrets._fetch_secret.cache_clear()
+
+
+def test_failed_lookups_are_bounded(monkeypatch: pytest.MonkeyPatch):
+    class MissingClient:
+        def get_secret_value(self, SecretId: str):  # noqa: N803 - boto3 signature
+            raise ClientError({"Error": {"Code": "ResourceNotFoundException"}}, "GetSecretValue")
+
+    clock = [1000.0]
+    missing: dict[str, float] = {}
+    monkeypatch.setattr(aws_secrets, "_client", lambda: MissingClient())
+    monkeypatch.setattr(aws_secrets, "_monotonic", lambda: clock[0])
+    monkeypatch.setattr(aws_secrets, "_MISSING_UNTIL", missing)
+    aws_secrets._fetch_secret.cache_clear()
+
+    for index in range(aws_secrets._MAX_MISSING + 10):
+        assert aws_secrets.get_secret(f"missing-{index}") is None
+    assert len(missing) == aws_secrets._MAX_MISSING
+    assert "missing-0" not in missing
+
+    clock[0] += aws_secrets._NEGATIVE_TTL_SECONDS
+    assert aws_secrets.get_secret("missing-late") is None
+    assert list(missing) == ["missing-late"]
+    aws_secrets._fetch_secret.cache_clear()
+
+
+def test_failed_lookups_are_safe_across_threads(monkeypatch: pytest.MonkeyPatch):
+    class MissingClient:
+        def get_secret_value(self, SecretId: str):  # noqa: N803 - boto3 signature
+            raise ClientError({"Error": {"Code": "ResourceNotFoundException"}}, "GetSecretValue")
+
+    clock = [1000.0]
+    missing: dict[str, float] = {}
+    monkeypatch.setattr(aws_secrets, "_client", lambda: MissingClient())
+    monkeypatch.setattr(aws_secrets, "_monotonic", lambda: clock[0])
+    monkeypatch.setattr(aws_secrets, "_MISSING_UNTIL", missing)
+    aws_secrets._fetch_secret.cache_clear()
+
+    names = [f"missing-{index % 300}" for index in range(2000)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert not any(executor.map(aws_secrets.get_secret, names))
+        clock[0] += aws_secrets._NEGATIVE_TTL_SECONDS
+        assert not any(executor.map(aws_secrets.get_secret, names))
+
+    assert len(missing) <= aws_secrets._MAX_MISSING
+    aws_secrets._fetch_secret.cache_clear()
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
-from src.config.loader import load_config
+import pytest
+
+from src.config import loader
+from src.config.loader import load_config, load_defaults
 
 from tests.helpers_config import StubCredentialStore, write_defaults
 
@@ -52,3 +56,134 @@ storage:
     # Environment values should override secrets, but remain below explicit overrides
     assert config["jira"]["credentials"]["client_secret"] == "env-secret"
     assert config["webhooks"]["jira"]["secret"] == "webhook-secret"
+
+
+def test_defaults_as_dict_is_cached_but_not_shared(tmp_path: Path) -> None:
+    defaults = load_defaults({"RC_ROOT": str(tmp_path)})
+
+    first = defaults.as_dict()
+    first["cache_dir"] = "mutated"
+
+    assert defaults.as_dict()["cache_dir"] == str(tmp_path.resolve() / "temp_data")
+
+
+def test_settings_file_cache_returns_copies_and_tracks_edits(tmp_path: Path) -> None:
+    settings = tmp_path / "settings.yaml"
+    settings.write_text("jira:\n  base_url: https://one.example.com\n", encoding="utf-8")
+
+    first = loader._load_settings_file(settings)
+    first["jira"]["base_url"] = "mutated"
+    assert loader._load_settings_file(settings)["jira"]["base_url"] == "https://one.example.com"
+
+    settings.write_text("jira:\n  base_url: https://second.example.com\n", encoding="utf-8")
+    assert loader._load_settings_file(settings)["jira"]["base_url"] == "https://second.example.com"
+
+
+def test_settings_sidecar_cache_skips_reparse(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RC_CONFIG_CACHE", "1")
+    settings = tmp_path / "settings.yaml"
+    settings.write_text("aws:\n  region: us-west-2\n", encoding="utf-8")
+
+    assert loader._load_settings_file(settings) == {"aws": {"region": "us-west-2"}}
+    assert (tmp_path / "settings.yaml.cache.json").exists()
+
+    loader._SETTINGS_CACHE.clear()
+
+    def _fail(path: Path) -> None:
+        raise AssertionError("sidecar should have been used")
+
+    monkeypatch.setattr(loader, "_parse_yaml_file", _fail)
+    assert loader._load_settings_file(settings) == {"aws": {"region": "us-west-2"}}
+
+
+def test_settings_sidecar_cache_tracks_restored_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RC_CONFIG_CACHE", "1")
+    settings = tmp_path / "settings.yaml"
+    settings.write_text("aws:\n  region: us-west-2\n", encoding="utf-8")
+    original = settings.stat()
+    loader._load_settings_file(settings)
+
+    # Replace the source with different contents but an older mtime, as a
+    # checkout or backup restore would.
+    settings.write_text("aws:\n  region: eu-central-1\n", encoding="utf-8")
+    os.utime(settings, ns=(original.st_atime_ns, original.st_mtime_ns - 10**9))
+    loader._SETTINGS_CACHE.clear()
+
+    assert loader._load_settings_file(settings) == {"aws": {"region": "eu-central-1"}}
+
+
+def test_settings_sidecar_skips_trees_json_cannot_represent(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RC_CONFIG_CACHE", "1")
+    settings = tmp_path / "settings.yaml"
+    settings.write_text("release:\n  date: 2024-05-01\n  1: one\n", encoding="utf-8")
+
+    loaded = loader._load_settings_file(settings)
+
+    assert loaded["release"][1] == "one"
+    assert not (tmp_path / "settings.yaml.cache.json").exists()
+
+
+def test_defaults_file_is_parsed_as_yaml_whatever_its_suffix(tmp_path: Path) -> None:
+    defaults = write_defaults(tmp_path)
+    renamed = defaults.with_suffix(".conf")
+    defaults.rename(renamed)
+
+    config = load_config(
+        defaults_path=renamed,
+        override_path=tmp_path / "missing.yaml",
+        env={},
+        credential_store=StubCredentialStore({}),
+    )
+
+    assert config["aws"]["region"]
+
+
+def test_load_config_result_does_not_alias_cached_or_caller_data(tmp_path: Path) -> None:
+    defaults = write_defaults(tmp_path)
+    overrides = {"jira": {"scopes": {"project": "OVR"}}, "bitbucket": {"repositories": ["one"]}}
+
+    def _load() -> dict:
+        return load_config(
+            defaults_path=defaults,
+            override_path=tmp_path / "missing.yaml",
+            overrides=overrides,
+            env={},
+            credential_store=StubCredentialStore({}),
+        )
+
+    first = _load()
+    first["aws"]["region"] = "mutated"
+    first["jira"]["scopes"]["project"] = "mutated"
+    first["bitbucket"]["repositories"].append("mutated")
+
+    second = _load()
+    assert second["aws"]["region"] != "mutated"
+    assert second["jira"]["scopes"]["project"] == "OVR"
+    assert second["bitbucket"]["repositories"] == ["one"]
+    assert overrides == {"jira": {"scopes": {"project": "OVR"}}, "bitbucket": {"repositories": ["one"]}}
+
+
+def test_load_defaults_is_memoised_on_relevant_env(tmp_path: Path) -> None:
+    env = {"RC_ROOT": str(tmp_path), "UNRELATED": "1"}
+
+    first = load_defaults(env)
+    assert load_defaults({"RC_ROOT": str(tmp_path)}) is first
+
+    changed = load_defaults({"RC_ROOT": str(tmp_path), "RC_EXPORT_FORMATS": "json"})
+    assert changed is not first
+    assert changed.export_formats == ("json",)
+
+
+def test_secret_payloads_fetched_once_per_arn() -> None:
+    calls: list[str] = []
+
+    class _RecordingStore(StubCredentialStore):
+        def get_all_from_secret(self, secret_id):
+            calls.append(secret_id)
+            return super().get_all_from_secret(secret_id)
+
+    store = _RecordingStore({"arn:a": {"k": "a"}, "arn:b": {"k": "b"}})
+    payloads = loader._load_secret_payloads(store, ["arn:a", "arn:b", "arn:a"])
+
+    assert payloads == {"arn:a": {"k": "a"}, "arn:b": {"k": "b"}}
+    assert sorted(calls) == ["arn:a", "arn:b"]
@@ -1,6 +1,8 @@
+import json
 from pathlib import Path
 
-from src.export.exporter import export_all
+from exporters.json_exporter import JSONExporter
+from src.export.exporter import build_export_payload, export_all
 
 
 def test_export_creates_files(tmp_path: Path) -> None:
@@ -18,3 +20,35 @@ def test_export_creates_files(tmp_path: Path) -> None:
     assert (tmp_path / "summary.json").exists()
     assert outputs["json"].exists()
     assert outputs["excel"].exists()
+
+
+def test_export_summary_matches_stdlib_formatting(tmp_path: Path) -> None:
+    summary = {
+        "total_issues": 3,
+        "coverage": 0.1 + 0.2,
+        "velocity": float("nan"),
+        "owner": "Zoë",
+        "by_status": {"Done": [1, 2]},
+    }
+
+    outputs = export_all({"summary": summary}, out_dir=tmp_path, formats=["json"])
+
+    assert outputs["summary"].read_text(encoding="utf-8") == json.dumps(summary, indent=2)
+
+
+def test_build_export_payload_reuses_lists_and_materialises_iterators() -> None:
+    matched = [{"issue_key": "MOB-1"}]
+
+    payload = build_export_payload(matched=matched, orphans=iter([{"message": "wip"}]))
+
+    assert payload["commit_story_mapping"] is matched
+    assert payload["orphan_commits"] == [{"message": "wip"}]
+    assert payload["stories_with_no_commits"] == []
+
+
+def test_json_exporter_streams_large_payloads_verbatim(tmp_path: Path) -> None:
+    payload = {"commit_story_mapping": [{"issue_key": f"MOB-{i}", "hash": "a" * 40} for i in range(5000)]}
+
+    output_path = JSONExporter(tmp_path).export(payload, "large.json")
+
+    assert output_path.read_text(encoding="utf-8") == json.dumps(payload, indent=2)
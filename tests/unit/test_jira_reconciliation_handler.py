@@ -5,24 +5,51 @@ from typing import Any, Dict, List
 import pytest
 
 
+# Jira search responses are served pre-serialised; the fake HTTP client would
+# otherwise rebuild and re-encode the same payload on every request.
+_ONE_ISSUE_PAGE = json.dumps(
+    {
+        "issues": [
+            {
+                "id": "1000",
+                "key": "ABC-1",
+                "fields": {
+                    "updated": "2024-05-01T12:00:00.000+0000",
+                    "project": {"key": "ABC"},
+                    "status": {"name": "In Progress"},
+                    "assignee": {"displayName": "Ada"},
+                    "fixVersions": [{"name": "2024.05"}],
+                },
+            }
+        ],
+        "total": 1,
+    }
+)
+_EMPTY_PAGE = json.dumps({"issues": [], "total": 0})
+
+
+@pytest.fixture(scope="module")
+def handler() -> Any:
+    # The handler only reads its environment at import time, so a single
+    # reload per module is enough; per-test state is patched below.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TABLE_NAME", "test-table")
+        mp.setenv("JIRA_BASE_URL", "https://example.atlassian.net")
+        mp.setenv("FIX_VERSIONS", "")
+        mp.setenv("JQL_TEMPLATE", "fixVersion = '{fix_version}'")
+        mp.setenv("JIRA_SECRET_ARN", "arn:aws:secretsmanager:region:acct:secret")
+        mp.setenv("METRICS_NAMESPACE", "Test/Jira")
+        mp.setenv("RC_DDB_MAX_ATTEMPTS", "2")
+        mp.setenv("RC_DDB_BASE_DELAY", "0.01")
+        mp.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        mp.setenv("AWS_EC2_METADATA_DISABLED", "true")
+        return importlib.reload(importlib.import_module("services.jira_reconciliation_job.handler"))
+
+
 @pytest.fixture(autouse=True)
-def _reset_module(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("TABLE_NAME", "test-table")
-    monkeypatch.setenv("JIRA_BASE_URL", "https://example.atlassian.net")
-    monkeypatch.setenv("FIX_VERSIONS", "")
-    monkeypatch.setenv("JQL_TEMPLATE", "fixVersion = '{fix_version}'")
-    monkeypatch.setenv("JIRA_SECRET_ARN", "arn:aws:secretsmanager:region:acct:secret")
-    monkeypatch.setenv("METRICS_NAMESPACE", "Test/Jira")
-    monkeypatch.setenv("RC_DDB_MAX_ATTEMPTS", "2")
-    monkeypatch.setenv("RC_DDB_BASE_DELAY", "0.01")
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
-    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
-    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
-    monkeypatch.setenv("AWS_EC2_METADATA_DISABLED", "true")
-    module = importlib.reload(importlib.import_module("services.jira_reconciliation_job.handler"))
-    monkeypatch.setitem(module.__dict__, "_SECRET_CACHE", {"JIRA_EMAIL": "user", "JIRA_API_TOKEN": "token"})
-    monkeypatch.setitem(module.__dict__, "_SECRETS", None)
+def _reset_module(monkeypatch: pytest.MonkeyPatch, handler: Any) -> None:
+    monkeypatch.setitem(handler.__dict__, "_SECRET_CACHE", {"JIRA_EMAIL": "user", "JIRA_API_TOKEN": "token"})
+    monkeypatch.setitem(handler.__dict__, "_SECRETS", None)
 
 
 class DummyTable:
@@ -58,36 +85,19 @@ class DummyCloudWatch:
         self.metric_payloads.append({"Namespace": Namespace, "MetricData": MetricData})
 
 
-def _install_table(monkeypatch: pytest.MonkeyPatch, table: DummyTable) -> Any:
-    module = importlib.import_module("services.jira_reconciliation_job.handler")
+def _install_table(monkeypatch: pytest.MonkeyPatch, module: Any, table: DummyTable) -> Any:
     monkeypatch.setitem(module.__dict__, "_TABLE", table)
     cw = DummyCloudWatch()
     monkeypatch.setitem(module.__dict__, "_CLOUDWATCH", cw)
     return module, cw
 
 
-def test_reconciliation_upserts_new_issue(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_reconciliation_upserts_new_issue(monkeypatch: pytest.MonkeyPatch, handler: Any) -> None:
     table = DummyTable()
-    module, cw = _install_table(monkeypatch, table)
+    module, cw = _install_table(monkeypatch, handler, table)
 
     def fake_http_request(method: str, url: str, headers=None, data=None) -> str:  # pragma: no cover - exercised indirectly
-        payload = {
-            "issues": [
-                {
-                    "id": "1000",
-                    "key": "ABC-1",
-                    "fields": {
-                        "updated": "2024-05-01T12:00:00.000+0000",
-                        "project": {"key": "ABC"},
-                        "status": {"name": "In Progress"},
-                        "assignee": {"displayName": "Ada"},
-                        "fixVersions": [{"name": "2024.05"}],
-                    },
-                }
-            ],
-            "total": 1,
-        }
-        return json.dumps(payload)
+        return _ONE_ISSUE_PAGE
 
     monkeypatch.setitem(module.__dict__, "_http_request", fake_http_request)
 
@@ -101,7 +111,7 @@ def test_reconciliation_upserts_new_issue(monkeypatch: pytest.MonkeyPatch) -> No
     assert cw.metric_payloads
 
 
-def test_reconciliation_marks_missing_issue(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_reconciliation_marks_missing_issue(monkeypatch: pytest.MonkeyPatch, handler: Any) -> None:
     existing = {
         "issue_id": "1000",
         "fix_version": "2024.05",
@@ -109,10 +119,10 @@ def test_reconciliation_marks_missing_issue(monkeypatch: pytest.MonkeyPatch) ->
         "updated_at": "2024-04-01T00:00:00Z",
     }
     table = DummyTable([existing])
-    module, _ = _install_table(monkeypatch, table)
+    module, _ = _install_table(monkeypatch, handler, table)
 
     def fake_http_request(method: str, url: str, headers=None, data=None) -> str:  # pragma: no cover - exercised indirectly
-        return json.dumps({"issues": [], "total": 0})
+        return _EMPTY_PAGE
 
     monkeypatch.setitem(module.__dict__, "_http_request", fake_http_request)
 
@@ -125,12 +135,12 @@ def test_reconciliation_marks_missing_issue(monkeypatch: pytest.MonkeyPatch) ->
     assert update["UpdateExpression"].startswith("SET deleted = :true")
 
 
-def test_reconciliation_discovers_fix_versions_when_not_provided(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_reconciliation_discovers_fix_versions_when_not_provided(monkeypatch: pytest.MonkeyPatch, handler: Any) -> None:
     table = DummyTable()
-    module, _ = _install_table(monkeypatch, table)
+    module, _ = _install_table(monkeypatch, handler, table)
 
     def fake_http_request(method: str, url: str, headers=None, data=None) -> str:  # pragma: no cover - exercised indirectly
-        return json.dumps({"issues": [], "total": 0})
+        return _EMPTY_PAGE
 
     monkeypatch.setitem(module.__dict__, "_http_request", fake_http_request)
 
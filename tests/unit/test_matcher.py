@@ -1,3 +1,5 @@
+import json
+
 from src.matcher.engine import match
 
 
@@ -14,3 +16,19 @@ def test_match_basic():
     assert {issue["key"] for issue in missing} == {"MOB-2"}
     assert any("refactor" in commit["message"] for commit in orphans)
     assert summary["total_issues"] == 2
+
+
+def test_match_returns_plain_row_list():
+    issues = [{"key": "MOB-1"}]
+    commits = [
+        {"message": "feat: MOB-1 first", "hash": "a1"},
+        {"message": "fix: MOB-1 second", "hash": "b2"},
+    ]
+
+    matched, _, _, _ = match(issues, commits)
+
+    assert type(matched) is list
+    assert [row["issue_key"] for row in matched] == ["MOB-1", "MOB-1"]
+    matched[0]["note"] = "edited"
+    assert matched[0]["note"] == "edited"
+    assert json.loads(json.dumps(matched))[0]["note"] == "edited"
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
+import pytest
+from botocore.exceptions import ClientError
+
 from releasecopilot import uploader
 
 
@@ -9,7 +13,7 @@ class StubS3Client:
     def __init__(self) -> None:
         self.calls: list[dict] = []
 
-    def upload_file(self, filename: str, bucket: str, key: str, ExtraArgs: dict) -> None:  # noqa: N802 - boto3 signature
+    def upload_file(self, filename: str, bucket: str, key: str, ExtraArgs: dict, Config=None) -> None:  # noqa: N802,N803 - boto3 signature
         self.calls.append(
             {
                 "filename": filename,
@@ -49,6 +53,26 @@ def test_upload_directory_builds_versioned_keys(tmp_path: Path) -> None:
     assert json_call["extra_args"]["ContentType"] == "application/json"
 
 
+def test_upload_directory_stops_after_failed_upload(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for index in range(20):
+        (tmp_path / f"report-{index}.json").write_text("{}", encoding="utf-8")
+
+    class FailingS3Client(StubS3Client):
+        def upload_file(self, filename: str, bucket: str, key: str, ExtraArgs: dict, Config=None) -> None:  # noqa: N802,N803 - boto3 signature
+            super().upload_file(filename, bucket, key, ExtraArgs, Config)
+            # Give the caller time to queue every file before the failure.
+            time.sleep(0.05)
+            raise ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
+
+    monkeypatch.setattr(uploader, "_UPLOAD_WORKERS", 1)
+    client = FailingS3Client()
+
+    with pytest.raises(ClientError):
+        uploader.upload_directory("bucket", "prefix", tmp_path, "reports", client=client)
+
+    assert len(client.calls) < 20
+
+
 def test_upload_directory_skips_missing_directory(tmp_path: Path) -> None:
     client = StubS3Client()
 
@@ -61,3 +85,27 @@ def test_upload_directory_skips_missing_directory(tmp_path: Path) -> None:
     )
 
     assert client.calls == []
+
+
+def test_upload_directory_skips_directory_without_files(tmp_path: Path) -> None:
+    (tmp_path / "empty" / "nested").mkdir(parents=True)
+    client = StubS3Client()
+
+    uploader.upload_directory("bucket", "prefix", tmp_path / "empty", "reports", client=client)
+
+    assert client.calls == []
+
+
+def test_build_s3_client_reuses_default_client_per_region() -> None:
+    first = uploader.build_s3_client(region_name="us-west-2")
+
+    assert uploader.build_s3_client(region_name="us-west-2") is first
+    assert uploader.build_s3_client(region_name="us-east-1") is not first
+
+
+def test_default_client_pool_covers_upload_concurrency() -> None:
+    client = uploader.build_s3_client(region_name="eu-west-1")
+
+    assert client.meta.config.max_pool_connections == (
+        uploader._UPLOAD_WORKERS * uploader._TRANSFER_CONFIG.max_concurrency
+    )